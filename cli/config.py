@@ -10,7 +10,7 @@ VERSION = "v0.1.6/2025-09-03"
 # Full Documentation:
 # https://github.com/63klabs/atlantis-cfn-configuration-repo-for-serverless-deployments/
 
-import toml
+import tomli_w # Make sure to pip install tomli-w
 import json
 import yaml
 import re
@@ -35,6 +35,12 @@ from lib.atlantis import FileNameListUtils, DefaultsLoader, TagUtils, Utils
 from lib.gitops import Git
 from lib.codecommit_utils import CodeCommitUtils
 
+# Use tomllib from stdlib, fallback to tomli for older Python versions
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
 if sys.version_info[0] < 3:
     sys.stderr.write("Error: Python 3 is required\n")
     sys.exit(1)
@@ -1511,7 +1517,8 @@ class ConfigManager:
                 print()
 
                 samconfig_data = {'atlantis': {}, 'deployments': {}}
-                samconfig = toml.load(samconfig_path)
+                with open(samconfig_path, 'rb') as f:
+                    samconfig = tomllib.load(f)
                 
                 # Handle atlantis deploy parameters section
                 if 'atlantis' in samconfig and isinstance(samconfig['atlantis'], dict):
@@ -1704,7 +1711,7 @@ class ConfigManager:
             
             with open(samconfig_path, 'w') as f:
                 f.write(header)
-                toml.dump(atlantis_deploy_section, f)
+                f.write(tomli_w.dumps(atlantis_deploy_section))
                     
                 for section, section_config in non_atlantis_deploy_sections.items():
 
@@ -1744,7 +1751,7 @@ class ConfigManager:
                         section_config['deploy']['parameters']['tags'] = self.stringify_tags(tags)
                     
                     f.write(f'\n{deploy_section_header}\n')
-                    toml.dump({section: section_config}, f)
+                    f.write(tomli_w.dumps({section: section_config}))
                 
             Log.info(f"Configuration saved to '{samconfig_path}'")
 
@@ -150,7 +150,7 @@ class RepositoryCreator:
             if tag == None:
                 tag = GitHubUtils.get_latest_release(owner, repo)
 
-            source = f"https://github.com/{owner}/{repo}/archive/refs/tags/{tag}.zip"
+            source = GitHubUtils.build_release_zip_url(owner, repo, tag)
 
             return source, 'github'
         
@@ -162,7 +162,7 @@ class RepositoryCreator:
             owner = result['owner']
             repo = result['repo']
 
-            source = f"https://github.com/{owner}/{repo}/archive/refs/heads/main.zip"
+            source = GitHubUtils.build_source_zip_url(owner, repo)
 
             return source, 'github'
 
@@ -371,6 +371,8 @@ class RepositoryCreator:
     def _download_and_extract(self):
         temp_dir = tempfile.mkdtemp()
         zip_path = os.path.join(temp_dir, 'source.zip')
+        # Either zip_path or, for GitHub, an in-memory buffer
+        zip_source = zip_path
 
         if self.source_type == 's3':
 
@@ -401,7 +403,7 @@ class RepositoryCreator:
             click.echo(Colorize.output_with_value("Downloading zip from GitHub:", self.source))
             Log.info(f"Downloading zip from GitHub: {self.source}")
             # Download the zip file from GitHub
-            GitHubUtils.download_zip_from_url(self.source, zip_path)
+            zip_source = GitHubUtils.download_zip_to_buffer(self.source)
 
         else:
             
@@ -410,7 +412,7 @@ class RepositoryCreator:
             sys.exit(1)
 
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            with zipfile.ZipFile(zip_source, 'r') as zip_ref:
                 # For GitHub sources, identify the common prefix (outer directory)
                 common_prefix = None
                 if self.source_type == 'github':
@@ -526,7 +528,10 @@ class RepositoryCreator:
                         else:
                             output_path.write_bytes(content)
                             
-            os.remove(zip_path)
+            if zip_source is zip_path:
+                os.remove(zip_path)
+            else:
+                zip_source.close()
             
             # Log the number of extracted files
             file_count = 0
@@ -655,10 +660,9 @@ class RepositoryCreator:
             click.echo(Colorize.output(f"Seeding repository with {total_files} files"))
             Log.info(f"Creating initial commit with {total_files} files")
 
-            # Create a temporary directory for git operations
-            git_dir = tempfile.mkdtemp()
-
-            GitHubUtils.create_init_commit(all_files, self.repo_name, seed_branch, self.get_init_commit_author(), self.get_init_commit_email(), git_dir)
+            # Create a temporary directory for git operations, removed once the seed is pushed
+            with tempfile.TemporaryDirectory(prefix='gh-seed-') as git_dir:
+                GitHubUtils.create_init_commit(all_files, self.repo_name, seed_branch, self.get_init_commit_author(), self.get_init_commit_email(), git_dir)
 
             Log.info(f"Repository {self.repo_name} seeded successfully!")
             Log.info(f"Total files processed: {total_files}")
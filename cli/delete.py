@@ -9,15 +9,22 @@ VERSION = "v0.0.3/2025-08-26"
 # Full Documentation:
 # https://github.com/chadkluck/atlantis-cfn-configuration-repo-for-serverless-deployments/
 
-import toml
+import tomli_w # Make sure to pip install tomli-w
+import os
 import sys
 import argparse
 import click
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
-
-import random
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
+
+import hmac
+import secrets
 import string
 
 from lib.aws_session import AWSSessionManager
@@ -26,6 +33,12 @@ from lib.tools import Colorize
 from lib.atlantis import DefaultsLoader
 from lib.gitops import Git
 
+# Use tomllib from stdlib, fallback to tomli for older Python versions
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
 if sys.version_info[0] < 3:
     sys.stderr.write("Error: Python 3 is required\n")
     sys.exit(1)
@@ -33,9 +46,59 @@ if sys.version_info[0] < 3:
 # Initialize logger for this script
 ScriptLogger.setup('delete')
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
 SAMCONFIG_DIR = "samconfigs"
 SETTINGS_DIR = "defaults"
-VALID_INFRA_TYPES = ['pipeline', 'storage', 'network', 'iam']
+VALID_INFRA_TYPES = frozenset({'pipeline', 'storage', 'network', 'iam'})
+VALID_INFRA_TYPES_CHOICES = tuple(sorted(VALID_INFRA_TYPES)) # ordered for argparse help and messages
+SSM_DELETE_BATCH_SIZE = 10 # delete_parameters accepts at most 10 names per call
+SSM_DELETE_MAX_WORKERS = 5
+S3_DELETE_MAX_WORKERS = 10 # matches botocore's default connection pool size
+RESOURCE_DELETE_MAX_WORKERS = 4 # kept small since S3 bucket deletes run their own pool
+RESOURCE_LIST_MAX = 50 # resources listed before truncating (all are still written to the log)
+# Adaptive retries back off on throttling from waiter polls and concurrent delete_parameters calls
+AWS_CLIENT_CONFIG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=30
+)
+STACK_DELETE_WAIT_DELAY = 5 # seconds between waiter polls
+STACK_DELETE_WAIT_MAX_ATTEMPTS = 360 # 30 minutes max
+DESCRIBE_STACKS_EVENT = 'after-call.cloudformation.DescribeStacks'
+CONFIRMATION_CODE_ALPHABET = string.ascii_uppercase + string.digits
+
+# Common resources with retention policies
+RETAINED_RESOURCE_TYPES = ['s3', 'dynamodb:table', 'logs:log-group', 'ssm:parameter']
+
+# ARN service -> StackDestroyer method that deletes a resource of that service by its id
+RESOURCE_DELETE_HANDLERS = {
+    's3': '_delete_s3_bucket',
+    'dynamodb': '_delete_dynamodb_table',
+    'logs': '_delete_log_group',
+    'ssm': '_delete_ssm_parameter'
+}
+
+def _parse_arn(arn: str) -> Tuple[str, str, str, str, str, str]:
+    """Split an ARN into (partition, service, region, account, resource_type, resource_id).
+
+    The resource type is separated from the id by the first '/' or ':'
+    (e.g. table/name, log-group:name). Resources without a type, such as
+    S3 buckets, return an empty resource_type.
+    """
+    parts = arn.split(':', 5)
+    if len(parts) != 6 or parts[0] != 'arn':
+        raise ValueError(f"Invalid ARN: {arn}")
+
+    resource = parts[5]
+    separators = [i for i in (resource.find('/'), resource.find(':')) if i >= 0]
+    if separators:
+        i = min(separators)
+        resource_type, resource_id = resource[:i], resource[i + 1:]
+    else:
+        resource_type, resource_id = '', resource
+
+    return parts[1], parts[2], parts[3], parts[4], resource_type, resource_id
 
 class StackDestroyer:
     """
@@ -44,20 +107,24 @@ class StackDestroyer:
     
     def __init__(self, infra_type: str, prefix: str, project_id: str, stage_id: str, 
                     profile: Optional[str] = None, region: Optional[str] = None, 
-                    no_browser: Optional[bool] = False):
+                    no_browser: Optional[bool] = False, no_wait: Optional[bool] = False,
+                    interactive_per_resource: Optional[bool] = False, verbose: Optional[bool] = False):
         self.infra_type = infra_type
         self.prefix = prefix
         self.project_id = project_id
         self.stage_id = stage_id
         self.profile = profile
         self.region = region
+        self.no_wait = no_wait
+        self.interactive_per_resource = interactive_per_resource
+        self.verbose = verbose
         
         self._validate_args()
+
+        self.samconfig_file_path = self.get_samconfig_dir() / self.get_samconfig_file_name()
         
-        # Set up AWS session and clients
+        # Set up AWS session (clients are created on first use)
         self.aws_session = AWSSessionManager(profile, region, no_browser)
-        self.cfn_client = self.aws_session.get_client('cloudformation', region)
-        self.ssm_client = self.aws_session.get_client('ssm', region)
         
         config_loader = DefaultsLoader(
             settings_dir=self.get_settings_dir(),
@@ -68,22 +135,53 @@ class StackDestroyer:
         
         self.settings = config_loader.load_settings()
 
-        self.skipped_resources = []
+        self.skipped_resources: List[str] = []
+        self._stack_cache: Dict[str, Dict] = {}
+        self._stack_ids: Dict[str, str] = {}
+        self._last_stack_status: Optional[str] = None
+
+    @cached_property
+    def cfn_client(self):
+        """CloudFormation client, created on first use"""
+        return self.aws_session.get_client('cloudformation', self.region, config=AWS_CLIENT_CONFIG)
+
+    @cached_property
+    def ssm_client(self):
+        """SSM client, created on first use"""
+        return self.aws_session.get_client('ssm', self.region, config=AWS_CLIENT_CONFIG)
+
+    @cached_property
+    def tagging_client(self):
+        """Resource Groups Tagging API client, created on first use"""
+        return self.aws_session.get_client('resourcegroupstaggingapi', self.region, config=AWS_CLIENT_CONFIG)
+
+    @cached_property
+    def s3_client(self):
+        """S3 client, created on first use"""
+        return self.aws_session.get_client('s3', self.region, config=AWS_CLIENT_CONFIG)
+
+    @cached_property
+    def dynamodb_client(self):
+        """DynamoDB client, created on first use"""
+        return self.aws_session.get_client('dynamodb', self.region, config=AWS_CLIENT_CONFIG)
+
+    @cached_property
+    def logs_client(self):
+        """CloudWatch Logs client, created on first use"""
+        return self.aws_session.get_client('logs', self.region, config=AWS_CLIENT_CONFIG)
 
     def _validate_args(self) -> None:
         """Validate arguments"""
         if self.infra_type not in VALID_INFRA_TYPES:
-            raise click.UsageError(f"Invalid infra_type. Must be one of {VALID_INFRA_TYPES}")
+            raise click.UsageError(f"Invalid infra_type. Must be one of {list(VALID_INFRA_TYPES_CHOICES)}")
 
     def get_settings_dir(self) -> Path:
         """Get the settings directory path"""
-        script_dir = Path(__file__).resolve().parent
-        return script_dir.parent / SETTINGS_DIR
+        return REPO_ROOT / SETTINGS_DIR
 
     def get_samconfig_dir(self) -> Path:
         """Get the samconfig directory path"""
-        script_dir = Path(__file__).resolve().parent
-        return script_dir.parent / SAMCONFIG_DIR / self.prefix / self.project_id
+        return REPO_ROOT / SAMCONFIG_DIR / self.prefix / self.project_id
 
     def get_samconfig_file_name(self) -> str:
         """Get the samconfig file name"""
@@ -91,7 +189,7 @@ class StackDestroyer:
 
     def get_samconfig_file_path(self) -> Path:
         """Get the samconfig file path"""
-        return self.get_samconfig_dir() / self.get_samconfig_file_name()
+        return self.samconfig_file_path
 
     def get_pipeline_stack_name(self) -> str:
         """Get the pipeline stack name"""
@@ -101,6 +199,13 @@ class StackDestroyer:
         """Get the application stack name"""
         return f"{self.prefix}-{self.project_id}-{self.stage_id}-application"
 
+    def _describe_stack(self, stack_name: str) -> Dict:
+        """Get the stack description, calling describe_stacks only once per stack"""
+        if stack_name not in self._stack_cache:
+            response = self.cfn_client.describe_stacks(StackName=stack_name)
+            self._stack_cache[stack_name] = response['Stacks'][0]
+        return self._stack_cache[stack_name]
+
     def validate_stack_arn(self, stack_name: str, expected_name: str) -> bool:
         """Validate that the provided ARN matches the expected stack name"""
 
@@ -115,9 +220,9 @@ class StackDestroyer:
             # Extract stack name from ARN
             try:
                 # ARN format: arn:aws:cloudformation:region:account:stack/stack-name/stack-id
-                arn_parts = arn.split('/')
-                if len(arn_parts) >= 2:
-                    actual_stack_name = arn_parts[1]
+                _, service, _, _, resource_type, resource_id = _parse_arn(arn)
+                if service == 'cloudformation' and resource_type == 'stack':
+                    actual_stack_name = resource_id.split('/', 1)[0]
                     if actual_stack_name == expected_name:
                         return True
                     else:
@@ -130,7 +235,7 @@ class StackDestroyer:
                     click.echo(Colorize.error(message))
                     Log.error(f"{message}:  {arn}")
                     return False
-            except Exception as e:
+            except ValueError as e:
                 message = f"Error parsing ARN: {str(e)}"
                 click.echo(Colorize.error(message))
                 Log.error(f"{message} {arn}")
@@ -144,23 +249,20 @@ class StackDestroyer:
     def check_delete_tag(self, stack_name: str) -> bool:
         """Check if stack has DeleteOnOrAfter tag with valid date"""
         try:
-            response = self.cfn_client.describe_stacks(StackName=stack_name)
-            stack = response['Stacks'][0]
-            tags = {tag['Key']: tag['Value'] for tag in stack.get('Tags', [])}
-            
-            delete_date_str = tags.get('DeleteOnOrAfter')
+            stack = self._describe_stack(stack_name)
+            delete_date_str = next(
+                (tag['Value'] for tag in stack.get('Tags', []) if tag['Key'] == 'DeleteOnOrAfter'), None
+            )
             if not delete_date_str:
                 click.echo(Colorize.error(f"Stack {stack_name} does not have DeleteOnOrAfter tag"))
                 return False
             
-            # Parse date
+            # Parse date (dates and times without an offset, including a trailing Z, are UTC)
             try:
-                if delete_date_str.endswith('Z'):
-                    delete_date = datetime.fromisoformat(delete_date_str[:-1]).replace(tzinfo=timezone.utc)
-                    current_date = datetime.now(timezone.utc)
-                else:
-                    delete_date = datetime.fromisoformat(delete_date_str).date()
-                    current_date = datetime.now().date()
+                current_date = datetime.now(timezone.utc)
+                delete_date = datetime.fromisoformat(delete_date_str.rstrip('Z'))
+                if delete_date.tzinfo is None:
+                    delete_date = delete_date.replace(tzinfo=timezone.utc)
                 
                 if current_date >= delete_date:
                     message = f"DeleteOnOrAfter tag validation passed: {delete_date_str}"
@@ -178,8 +280,15 @@ class StackDestroyer:
                 Log.error(message)
                 return False
                 
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            message = f"Error checking DeleteOnOrAfter tag: {error_code} - {error_message}"
+            click.echo(Colorize.error(message))
+            Log.error(message)
+            return False
         except Exception as e:
-            message = f"Error checking DeleteOnOrAfter tag: {str(e)}"
+            message = f"Unexpected error checking DeleteOnOrAfter tag: {str(e)}"
             click.echo(Colorize.error(message))
             Log.error(message)
             return False
@@ -187,8 +296,7 @@ class StackDestroyer:
     def check_stack_termination_protection(self, stack_name: str) -> bool:
         """Check if stack termination protection is disabled"""
         try:
-            response = self.cfn_client.describe_stacks(StackName=stack_name)
-            stack = response['Stacks'][0]
+            stack = self._describe_stack(stack_name)
             
             termination_protection = stack.get('EnableTerminationProtection', False)
             
@@ -203,8 +311,15 @@ class StackDestroyer:
                 Log.error(message)
                 return False
                 
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            message = f"Error checking stack termination protection for {stack_name}: {error_code} - {error_message}"
+            click.echo(Colorize.error(message))
+            Log.error(message)
+            return False
         except Exception as e:
-            message = f"Error checking stack termination protection for {stack_name}: {str(e)}"
+            message = f"Unexpected error checking stack termination protection for {stack_name}: {str(e)}"
             click.echo(Colorize.error(message))
             Log.error(message)
             return False
@@ -213,87 +328,149 @@ class StackDestroyer:
         """Final confirmation by entering prefix, project_id, and stage_id"""
         click.echo(Colorize.warning("For final confirmation, please enter the Prefix, ProjectId, and StageId of the pipeline and application to delete."))
         
-        entered_prefix = Colorize.prompt("Prefix", "", str)
-        entered_project_id = Colorize.prompt("ProjectId", "", str)
-        entered_stage_id = Colorize.prompt("StageId", "", str)
-        
-        if (entered_prefix == self.prefix and 
-            entered_project_id == self.project_id and 
-            entered_stage_id == self.stage_id):
-            return True
-        else:
+        expected_values = (
+            ("Prefix", self.prefix),
+            ("ProjectId", self.project_id),
+            ("StageId", self.stage_id)
+        )
+
+        # Accept all three values on one line (e.g. acme/mywebapp/test)
+        entered = Colorize.prompt("Prefix/ProjectId/StageId", "", str).strip()
+        entered_values = [value.strip() for value in entered.split('/', len(expected_values) - 1)]
+        if len(entered_values) == len(expected_values):
+            if tuple(entered_values) == tuple(expected for _, expected in expected_values):
+                return True
             click.echo(Colorize.error("Confirmation failed. Values do not match."))
             Log.error("Confirmation failed. Values from user do not match.")
             return False
 
-    def delete_stack(self, stack_name: str) -> bool:
-        """Delete a CloudFormation stack"""
-        import time
-        
+        # Otherwise ask for each value, stopping at the first mismatch
+        click.echo(Colorize.warning("Expected Prefix/ProjectId/StageId. Please enter each value separately."))
+        for label, expected in expected_values:
+            entered = Colorize.prompt(label, "", str).strip()
+            if entered != expected:
+                click.echo(Colorize.error("Confirmation failed. Values do not match."))
+                Log.error(f"Confirmation failed. {label} from user does not match.")
+                return False
+
+        return True
+
+    def _echo_stack_status(self, parsed: dict, **kwargs) -> None:
+        """Event handler that reports the stack status from the waiter's DescribeStacks calls when it changes"""
+        stacks = parsed.get('Stacks', [])
+        if stacks and stacks[0]['StackStatus'] != self._last_stack_status:
+            self._last_stack_status = stacks[0]['StackStatus']
+            click.echo(Colorize.output(f"Stack deletion in progress... Status: {self._last_stack_status}"))
+            Log.info(f"Stack {stacks[0]['StackName']} status: {self._last_stack_status}")
+
+    def issue_delete_stack(self, stack_name: str) -> bool:
+        """Request deletion of a CloudFormation stack without waiting for it to complete"""
         try:
             click.echo(Colorize.output(f"Deleting stack: {stack_name}"))
             Log.info(f"Deleting stack: {stack_name}")
             
-            self.cfn_client.delete_stack(StackName=stack_name)
-            
-            # Custom polling loop with progress updates
-            max_attempts = 180  # 30 minutes max
-            attempt = 0
-            
-            while attempt < max_attempts:
-                try:
-                    response = self.cfn_client.describe_stacks(StackName=stack_name)
-                    stack_status = response['Stacks'][0]['StackStatus']
-                    
-                    if stack_status == 'DELETE_COMPLETE':
-                        click.echo(Colorize.success(f"Stack {stack_name} deleted successfully"))
-                        Log.info(f"Stack {stack_name} deleted successfully")
-                        return True
-                    elif stack_status in ['DELETE_FAILED', 'ROLLBACK_COMPLETE']:
-                        click.echo(Colorize.error(f"Stack deletion failed with status: {stack_status}"))
-                        Log.error(f"Stack deletion failed with status: {stack_status}")
-                        return False
-                    else:
-                        click.echo(Colorize.output(f"Stack deletion in progress... Status: {stack_status}"))
-                        
-                except self.cfn_client.exceptions.ClientError as e:
-                    if 'does not exist' in str(e):
-                        click.echo(Colorize.success(f"Stack {stack_name} deleted successfully"))
-                        Log.info(f"Stack {stack_name} deleted successfully")
-                        return True
-                    else:
-                        raise
-                
-                time.sleep(10)
-                attempt += 1
-            
-            click.echo(Colorize.error(f"Stack deletion timed out after 30 minutes"))
-            Log.error(f"Stack deletion timed out after 30 minutes")
+            # Track the stack by its unique id so it can still be described after deletion
+            stack_id = self._describe_stack(stack_name)['StackId']
+            self.cfn_client.delete_stack(StackName=stack_id)
+            self._stack_ids[stack_name] = stack_id
+            self._stack_cache.pop(stack_name, None)
+            return True
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            click.echo(Colorize.error(f"Error deleting stack {stack_name}: {error_code} - {error_message}"))
+            Log.error(f"Error deleting stack {stack_name}: {error_code} - {error_message}")
+            return False
+        except Exception as e:
+            click.echo(Colorize.error(f"Unexpected error deleting stack {stack_name}: {str(e)}"))
+            Log.error(f"Unexpected error deleting stack {stack_name}: {str(e)}")
             return False
+
+    def await_delete_stack(self, stack_name: str) -> bool:
+        """Wait for a previously issued stack deletion to complete"""
+        try:
+            # Wait for deletion, reporting progress from the waiter's DescribeStacks calls
+            self._last_stack_status = None
+            self.cfn_client.meta.events.register(DESCRIBE_STACKS_EVENT, self._echo_stack_status)
+            try:
+                waiter = self.cfn_client.get_waiter('stack_delete_complete')
+                waiter.wait(
+                    StackName=self._stack_ids.get(stack_name, stack_name),
+                    WaiterConfig={'Delay': STACK_DELETE_WAIT_DELAY, 'MaxAttempts': STACK_DELETE_WAIT_MAX_ATTEMPTS}
+                )
+            finally:
+                self.cfn_client.meta.events.unregister(DESCRIBE_STACKS_EVENT, self._echo_stack_status)
+
+            click.echo(Colorize.success(f"Stack {stack_name} deleted successfully"))
+            Log.info(f"Stack {stack_name} deleted successfully")
+            return True
         
+        except WaiterError as e:
+            reason = e.kwargs.get('reason', '')
+            if reason.startswith('Max attempts exceeded'):
+                minutes = STACK_DELETE_WAIT_DELAY * STACK_DELETE_WAIT_MAX_ATTEMPTS // 60
+                message = f"Stack deletion timed out after {minutes} minutes"
+            else:
+                stacks = (e.last_response or {}).get('Stacks', [])
+                stack_status = stacks[0]['StackStatus'] if stacks else 'UNKNOWN'
+                message = f"Stack deletion failed with status: {stack_status} ({reason})"
+            click.echo(Colorize.error(message))
+            Log.error(message)
+            return False
         except KeyboardInterrupt:
             click.echo(Colorize.error("\nOperation cancelled by user"))
             Log.info("Operation cancelled by user")
             sys.exit(1)
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            click.echo(Colorize.error(f"Error waiting for stack {stack_name} to delete: {error_code} - {error_message}"))
+            Log.error(f"Error waiting for stack {stack_name} to delete: {error_code} - {error_message}")
+            return False
         except Exception as e:
-            click.echo(Colorize.error(f"Error deleting stack {stack_name}: {str(e)}"))
-            Log.error(f"Error deleting stack {stack_name}: {str(e)}")
+            click.echo(Colorize.error(f"Unexpected error waiting for stack {stack_name} to delete: {str(e)}"))
+            Log.error(f"Unexpected error waiting for stack {stack_name} to delete: {str(e)}")
             return False
 
-    def delete_ssm_parameters(self) -> None:
-        """Delete SSM parameters associated with the application"""
+    def _iter_ssm_parameter_names(self, parameter_prefix: str) -> Iterator[str]:
+        """Yield the names of SSM parameters that begin with the prefix, one page at a time"""
+        paginator = self.ssm_client.get_paginator('describe_parameters')
+        pages = paginator.paginate(
+            ParameterFilters=[{'Key': 'Name', 'Option': 'BeginsWith', 'Values': [parameter_prefix]}],
+            PaginationConfig={'PageSize': 50} # describe_parameters maximum
+        )
+        for page in pages:
+            for param in page['Parameters']:
+                yield param['Name']
+
+    @staticmethod
+    def _iter_batches(items: Iterable[str], size: int) -> Iterator[List[str]]:
+        """Yield lists of at most size items without slicing copies of the source"""
+        iterator = iter(items)
+        while batch := list(islice(iterator, size)):
+            yield batch
+
+    def select_ssm_parameters(self) -> List[str]:
+        """List SSM parameters associated with the application and confirm their deletion.
+        Must be called before the application stack is deleted since the stack's
+        ParameterStoreHierarchy parameter is used to locate them.
+
+        Returns:
+            List[str]: Names of the parameters the user confirmed for deletion
+        """
         try:
             # Check for ParameterStoreHierarchy in application stack
             application_stack_name = self.get_application_stack_name()
             parameter_store_hierarchy = ""
             
             try:
-                response = self.cfn_client.describe_stacks(StackName=application_stack_name)
-                stack = response['Stacks'][0]
-                parameters = {param['ParameterKey']: param['ParameterValue'] for param in stack.get('Parameters', [])}
-                parameter_store_hierarchy = parameters.get('ParameterStoreHierarchy', '')
-            except Exception as e:
-                Log.warning(f"Could not get ParameterStoreHierarchy from stack {application_stack_name}: {str(e)}")
+                stack = self._describe_stack(application_stack_name)
+                parameter_store_hierarchy = next(
+                    (param['ParameterValue'] for param in stack.get('Parameters', []) if param['ParameterKey'] == 'ParameterStoreHierarchy'), ''
+                )
+            except ClientError as e:
+                Log.warning(f"Could not get ParameterStoreHierarchy from stack {application_stack_name}: {e.response['Error']['Code']} - {e.response['Error']['Message']}")
             
             application_suffix = f"/{self.prefix}-{self.project_id}-{self.stage_id}/"
 
@@ -303,51 +480,231 @@ class StackDestroyer:
             else:
                 parameter_prefix = application_suffix
             
-            # List parameters with the prefix
-            paginator = self.ssm_client.get_paginator('describe_parameters')
-            parameters_to_delete = []
-            
-            for page in paginator.paginate():
-                for param in page['Parameters']:
-                    if param['Name'].startswith(parameter_prefix):
-                        parameters_to_delete.append(param['Name'])
+            # List parameters with the prefix (kept so the user can review them before deleting)
+            parameters_to_delete = list(self._iter_ssm_parameter_names(parameter_prefix))
             
-            if parameters_to_delete:
-                click.echo(Colorize.output(f"Found {len(parameters_to_delete)} SSM parameters to delete"))
-                Log.info(f"Found {len(parameters_to_delete)} SSM parameters to delete: {parameters_to_delete}")
-                
-                # List the parameters
-                for param in parameters_to_delete:
-                    click.echo(Colorize.output(f" - {param}"))
-
-                # confirm deletion of parameters
-                print()
-                if not click.confirm(Colorize.question("Proceed with deletion of these SSM parameters?"), default=True):
-                    click.echo(Colorize.error("SSM parameter deletion cancelled by user"))
-                    Log.info("SSM parameter deletion cancelled by user")
-                    self.skipped_resources += parameters_to_delete
-                    return
-                
-                # Delete parameters in batches of 10 (AWS limit)
-                for i in range(0, len(parameters_to_delete), 10):
-                    batch = parameters_to_delete[i:i+10]
-                    self.ssm_client.delete_parameters(Names=batch)
-                    
-                click.echo(Colorize.success(f"Deleted {len(parameters_to_delete)} SSM parameters"))
-                Log.info(f"Deleted {len(parameters_to_delete)} SSM parameters")
-            else:
+            if not parameters_to_delete:
                 click.echo(Colorize.output("No SSM parameters found to delete"))
                 Log.info("No SSM parameters found to delete")
+                return []
+
+            click.echo(Colorize.output(f"Found {len(parameters_to_delete)} SSM parameters to delete"))
+            Log.info(f"Found {len(parameters_to_delete)} SSM parameters to delete: {parameters_to_delete}")
+            
+            # List the parameters
+            for param in parameters_to_delete:
+                click.echo(Colorize.output(f" - {param}"))
+
+            # confirm deletion of parameters
+            print()
+            if not click.confirm(Colorize.question("Proceed with deletion of these SSM parameters?"), default=True):
+                click.echo(Colorize.error("SSM parameter deletion cancelled by user"))
+                Log.info("SSM parameter deletion cancelled by user")
+                self.skipped_resources.extend(parameters_to_delete)
+                return []
+
+            return parameters_to_delete
+
+        except KeyboardInterrupt:
+            click.echo(Colorize.error("\nOperation cancelled by user"))
+            Log.info("Operation cancelled by user")
+            sys.exit(1)                
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            click.echo(Colorize.error(f"Error listing SSM parameters: {error_code} - {error_message}"))
+            Log.error(f"Error listing SSM parameters: {error_code} - {error_message}")
+        except Exception as e:
+            click.echo(Colorize.error(f"Unexpected error listing SSM parameters: {str(e)}"))
+            Log.error(f"Unexpected error listing SSM parameters: {str(e)}")
+
+        return []
+
+    def delete_ssm_parameters(self, parameters_to_delete: List[str]) -> None:
+        """Delete the SSM parameters confirmed by select_ssm_parameters"""
+        try:
+            deleted_count = 0
+            failed_parameters = []
+
+            # Delete parameters in concurrent batches of 10 (AWS limit)
+            with ThreadPoolExecutor(max_workers=SSM_DELETE_MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.ssm_client.delete_parameters, Names=batch): batch
+                    for batch in self._iter_batches(parameters_to_delete, SSM_DELETE_BATCH_SIZE)
+                }
+                for future in as_completed(futures):
+                    try:
+                        response = future.result()
+                        deleted_count += len(response.get('DeletedParameters', []))
+                        failed_parameters += response.get('InvalidParameters', [])
+                    except ClientError as e:
+                        Log.error(f"Error deleting SSM parameters {futures[future]}: {e.response['Error']['Code']} - {e.response['Error']['Message']}")
+                        failed_parameters += futures[future]
+
+            click.echo(Colorize.success(f"Deleted {deleted_count} SSM parameters"))
+            Log.info(f"Deleted {deleted_count} SSM parameters")
+
+            if failed_parameters:
+                message = f"Failed to delete {len(failed_parameters)} SSM parameters: {failed_parameters}"
+                click.echo(Colorize.error(message))
+                Log.error(message)
 
         except KeyboardInterrupt:
             click.echo(Colorize.error("\nOperation cancelled by user"))
             Log.info("Operation cancelled by user")
             sys.exit(1)                
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            click.echo(Colorize.error(f"Error deleting SSM parameters: {error_code} - {error_message}"))
+            Log.error(f"Error deleting SSM parameters: {error_code} - {error_message}")
         except Exception as e:
-            click.echo(Colorize.error(f"Error deleting SSM parameters: {str(e)}"))
-            Log.error(f"Error deleting SSM parameters: {str(e)}")
+            click.echo(Colorize.error(f"Unexpected error deleting SSM parameters: {str(e)}"))
+            Log.error(f"Unexpected error deleting SSM parameters: {str(e)}")
 
 
+    def _delete_s3_bucket(self, bucket_name: str) -> None:
+        """Empty (all object versions and delete markers) and delete an S3 bucket"""
+        s3_client = self.s3_client
+        errors = []
+
+        def collect_errors(futures) -> None:
+            for future in futures:
+                errors.extend(future.result().get('Errors', []))
+        
+        # Delete each page of up to 1000 versions (AWS limit) while the next page is listed
+        paginator = s3_client.get_paginator('list_object_versions')
+        with ThreadPoolExecutor(max_workers=S3_DELETE_MAX_WORKERS) as executor:
+            pending = set()
+            for page in paginator.paginate(Bucket=bucket_name, PaginationConfig={'PageSize': 1000}):
+                objects_to_delete = []
+                
+                # Collect versions and delete markers
+                for version in page.get('Versions', []):
+                    objects_to_delete.append({'Key': version['Key'], 'VersionId': version['VersionId']})
+                for marker in page.get('DeleteMarkers', []):
+                    objects_to_delete.append({'Key': marker['Key'], 'VersionId': marker['VersionId']})
+                
+                if objects_to_delete:
+                    # Limit how many listed pages are held in memory waiting to be deleted
+                    if len(pending) >= S3_DELETE_MAX_WORKERS * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect_errors(done)
+                    pending.add(executor.submit(
+                        s3_client.delete_objects,
+                        Bucket=bucket_name,
+                        Delete={'Objects': objects_to_delete, 'Quiet': True}
+                    ))
+
+            collect_errors(as_completed(pending))
+
+        if errors:
+            Log.error(f"Errors deleting objects from S3 bucket {bucket_name}: {errors}")
+            raise RuntimeError(f"Failed to delete {len(errors)} object version(s) from bucket {bucket_name}")
+        
+        # Delete the bucket
+        s3_client.delete_bucket(Bucket=bucket_name)
+        click.echo(Colorize.success(f"Deleted S3 bucket: {bucket_name}"))
+        Log.info(f"Deleted S3 bucket: {bucket_name}")
+
+    def _delete_dynamodb_table(self, table_name: str) -> None:
+        """Delete a DynamoDB table"""
+        self.dynamodb_client.delete_table(TableName=table_name)
+        click.echo(Colorize.success(f"Deleted DynamoDB table: {table_name}"))
+        Log.info(f"Deleted DynamoDB table: {table_name}")
+
+    def _delete_log_group(self, log_group_name: str) -> None:
+        """Delete a CloudWatch log group"""
+        self.logs_client.delete_log_group(logGroupName=log_group_name)
+        click.echo(Colorize.success(f"Deleted CloudWatch log group: {log_group_name}"))
+        Log.info(f"Deleted CloudWatch log group: {log_group_name}")
+
+    def _delete_ssm_parameter(self, parameter_name: str) -> None:
+        """Delete a single SSM parameter"""
+        self.ssm_client.delete_parameter(Name=parameter_name)
+        click.echo(Colorize.success(f"Deleted SSM parameter: {parameter_name}"))
+        Log.info(f"Deleted SSM parameter: {parameter_name}")
+
+    @staticmethod
+    def _confirm_with_code() -> bool:
+        """Have the user retype a random 5 character code to confirm a deletion"""
+        code = ''.join(secrets.choice(CONFIRMATION_CODE_ALPHABET) for _ in range(5))
+        # display code to user with spaces so they don't copy/paste
+        display_code = ' '.join(code)
+        entered_code = Colorize.prompt(f"Type the code '{display_code}' (without spaces) to confirm deletion", "", str)
+        return hmac.compare_digest(entered_code.encode(), code.encode())
+
+    def _delete_resource(self, res: str) -> None:
+        """Delete a single resource by ARN using the handler for its service"""
+        try:
+            _, service, _, _, _, resource_id = _parse_arn(res)
+            delete_handler = RESOURCE_DELETE_HANDLERS.get(service)
+            if delete_handler:
+                getattr(self, delete_handler)(resource_id)
+            else:
+                click.echo(Colorize.warning(f"Unsupported resource type for deletion: {res}"))
+                Log.warning(f"Unsupported resource type for deletion: {res}")
+
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            click.echo(Colorize.error(f"Error deleting resource {res}: {str(e)}"))
+            Log.error(f"Error deleting resource {res}: {str(e)}")
+
+    def _delete_resources_per_resource(self, resources_to_delete: List[str]) -> None:
+        """Delete resources one by one, confirming each with y/N and a random code"""
+        for res in resources_to_delete:
+            print()
+            click.echo(Colorize.output(f"Preparing to delete resource: {res}"))
+            if click.confirm(Colorize.question(f"Are you sure you want to delete resource: {res}?"), default=False):
+                if self._confirm_with_code():
+                    self._delete_resource(res)
+                else:
+                    click.echo(Colorize.error("Confirmation code mismatch. Skipping deletion."))
+                    Log.info(f"Confirmation code mismatch for resource: {res}. Skipping deletion.")
+                    self.skipped_resources.append(res)
+
+            else:
+                click.echo(Colorize.warning(f"Skipping deletion of resource: {res}"))
+                Log.info(f"Skipping deletion of resource: {res}")
+                self.skipped_resources.append(res)
+
+    def _delete_resources_per_service(self, resources_to_delete: List[str]) -> None:
+        """Delete resources grouped by service, confirming each group once with y/N and a random code"""
+        resources_by_service: Dict[str, List[str]] = {}
+        for res in resources_to_delete:
+            resources_by_service.setdefault(_parse_arn(res)[1], []).append(res)
+
+        for service, resources in resources_by_service.items():
+            print()
+            click.echo(Colorize.output(f"Preparing to delete {len(resources)} {service} resource(s)"))
+            if click.confirm(Colorize.question(f"Are you sure you want to delete all {len(resources)} {service} resource(s)?"), default=False):
+                if self._confirm_with_code():
+                    # Create the service's client here, as cached_property and client creation aren't thread-safe
+                    if service in RESOURCE_DELETE_HANDLERS:
+                        getattr(self, f"{service}_client")
+                    with ThreadPoolExecutor(max_workers=RESOURCE_DELETE_MAX_WORKERS) as executor:
+                        # _delete_resource reports its own errors, so just drain the results
+                        for _ in executor.map(self._delete_resource, resources):
+                            pass
+                else:
+                    click.echo(Colorize.error("Confirmation code mismatch. Skipping deletion."))
+                    Log.info(f"Confirmation code mismatch for {service} resources. Skipping deletion.")
+                    self.skipped_resources.extend(resources)
+
+            else:
+                click.echo(Colorize.warning(f"Skipping deletion of {service} resources"))
+                Log.info(f"Skipping deletion of {service} resources: {resources}")
+                self.skipped_resources.extend(resources)
+
+    def _echo_resource_list(self, resources: List[str]) -> None:
+        """List resources in a single write, truncated unless --verbose"""
+        shown = resources if self.verbose else resources[:RESOURCE_LIST_MAX]
+        lines = [f" - {res}" for res in shown]
+        if len(resources) > len(shown):
+            lines.append(f"   (+{len(resources) - len(shown)} more, use --verbose to list all)")
+        click.echo(Colorize.output('\n'.join(lines)))
+
     def delete_resources_by_tag(self) -> None:
         """Discover and delete resources by atlantis:ApplicationDeploymentId tag"""
 
@@ -361,21 +718,12 @@ class StackDestroyer:
             click.echo(Colorize.output(f"Searching for resources with tag {tag_key}={tag_value}"))
             Log.info(f"Searching for resources with tag {tag_key}={tag_value}")
 
-            # Common resources with retention policies
-            resource_types = [
-                's3',
-                'dynamodb:table',
-                'logs:log-group',
-                'ssm:parameter'
-            ]
-
             resources_to_delete = []
 
-            for resource_type in resource_types:
-                paginator = self.aws_session.get_client('resourcegroupstaggingapi', self.region).get_paginator('get_resources')
-                for page in paginator.paginate(ResourceTypeFilters=[resource_type], TagFilters=[{'Key': tag_key, 'Values': [tag_value]}]):
-                    for resource in page['ResourceTagMappingList']:
-                        resources_to_delete.append(resource['ResourceARN'])
+            paginator = self.tagging_client.get_paginator('get_resources')
+            for page in paginator.paginate(ResourceTypeFilters=RETAINED_RESOURCE_TYPES, TagFilters=[{'Key': tag_key, 'Values': [tag_value]}]):
+                for resource in page['ResourceTagMappingList']:
+                    resources_to_delete.append(resource['ResourceARN'])
 
             if resources_to_delete:
                 click.echo(Colorize.output(f"Found {len(resources_to_delete)} additional resource(s) to delete"))
@@ -385,95 +733,20 @@ class StackDestroyer:
                 Log.info(f"Found {len(resources_to_delete)} resources to delete: {resources_to_delete}")
 
                 # List the resources
-                for res in resources_to_delete:
-                    click.echo(Colorize.output(f" - {res}"))
+                self._echo_resource_list(resources_to_delete)
 
                 # confirm deletion of resources
                 print()
                 if not click.confirm(Colorize.question("Proceed with deletion of these resources?")):
                     click.echo(Colorize.error("Resource deletion cancelled by user"))
                     Log.info("Resource deletion cancelled by user")
-                    self.skipped_resources += resources_to_delete
+                    self.skipped_resources.extend(resources_to_delete)
                     return
 
-                # Delete resources one by one with confirmation, list the resource and have user confirm y/N and if yes further confirm with a random 5 character code
-                for res in resources_to_delete:
-                    print()
-                    click.echo(Colorize.output(f"Preparing to delete resource: {res}"))
-                    if click.confirm(Colorize.question(f"Are you sure you want to delete resource: {res}?"), default=False):
-
-                        # Generate a random 5 character code
-                        code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-                        # display code to user with spaces so they don't copy/paste
-                        display_code = ' '.join(code)
-                        entered_code = Colorize.prompt(f"Type the code '{display_code}' (without spaces) to confirm deletion", "", str)
-                        if entered_code == code:
-                            try:
-                                if res.startswith("arn:aws:s3:::"):
-                                    s3_client = self.aws_session.get_client('s3', self.region)
-                                    bucket_name = res.split(":::")[1]
-                                    
-                                    # Use batch delete for better performance
-                                    paginator = s3_client.get_paginator('list_object_versions')
-                                    for page in paginator.paginate(Bucket=bucket_name):
-                                        objects_to_delete = []
-                                        
-                                        # Collect versions and delete markers
-                                        for version in page.get('Versions', []):
-                                            objects_to_delete.append({'Key': version['Key'], 'VersionId': version['VersionId']})
-                                        for marker in page.get('DeleteMarkers', []):
-                                            objects_to_delete.append({'Key': marker['Key'], 'VersionId': marker['VersionId']})
-                                        
-                                        # Delete in batches of 1000 (AWS limit)
-                                        if objects_to_delete:
-                                            s3_client.delete_objects(
-                                                Bucket=bucket_name,
-                                                Delete={'Objects': objects_to_delete}
-                                            )
-                                    
-                                    # Delete the bucket
-                                    s3_client.delete_bucket(Bucket=bucket_name)
-                                    click.echo(Colorize.success(f"Deleted S3 bucket: {bucket_name}"))
-                                    Log.info(f"Deleted S3 bucket: {bucket_name}")
-                                elif ":dynamodb:table/" in res:
-                                    dynamodb_client = self.aws_session.get_client('dynamodb', self.region)
-                                    table_name = res.split("/")[-1]
-                                    dynamodb_client.delete_table(TableName=table_name)
-                                    click.echo(Colorize.success(f"Deleted DynamoDB table: {table_name}"))
-                                    Log.info(f"Deleted DynamoDB table: {table_name}")
-                                elif ":logs:" in res:
-                                    logs_client = self.aws_session.get_client('logs', self.region)
-                                    log_group_name = res.split(":log-group:")[-1]
-                                    logs_client.delete_log_group(logGroupName=log_group_name)
-                                    click.echo(Colorize.success(f"Deleted CloudWatch log group: {log_group_name}"))
-                                    Log.info(f"Deleted CloudWatch log group: {log_group_name}")
-                                elif ":ssm:" in res:
-                                    ssm_client = self.aws_session.get_client('ssm', self.region)
-                                    parameter_name = res.split(":parameter/")[-1]
-                                    ssm_client.delete_parameter(Name=parameter_name)
-                                    click.echo(Colorize.success(f"Deleted SSM parameter: {parameter_name}"))
-                                    Log.info(f"Deleted SSM parameter: {parameter_name}")
-                                else:
-                                    click.echo(Colorize.warning(f"Unsupported resource type for deletion: {res}"))
-                                    Log.warning(f"Unsupported resource type for deletion: {res}")
-
-                            except KeyboardInterrupt:
-                                click.echo(Colorize.error("\nOperation cancelled by user"))
-                                Log.info("Operation cancelled by user")
-                                sys.exit(1)
-                            except Exception as e:
-                                click.echo(Colorize.error(f"Error deleting resource {res}: {str(e)}"))
-                                Log.error(f"Error deleting resource {res}: {str(e)}")
-
-                        else:
-                            click.echo(Colorize.error("Confirmation code mismatch. Skipping deletion."))
-                            Log.info(f"Confirmation code mismatch for resource: {res}. Skipping deletion.")
-                            self.skipped_resources.append(res)
-
-                    else:
-                        click.echo(Colorize.warning(f"Skipping deletion of resource: {res}"))
-                        Log.info(f"Skipping deletion of resource: {res}")
-                        self.skipped_resources.append(res)
+                if self.interactive_per_resource:
+                    self._delete_resources_per_resource(resources_to_delete)
+                else:
+                    self._delete_resources_per_service(resources_to_delete)
 
             else:
                 click.echo(Colorize.output("No additional resources found to delete"))
@@ -499,8 +772,8 @@ class StackDestroyer:
         if click.confirm(Colorize.question("Delete samconfig entry for this deployment?")):
             try:
                 # Load current config
-                with open(samconfig_path, 'r') as f:
-                    config = toml.load(f)
+                with open(samconfig_path, 'rb') as f:
+                    config = tomllib.load(f)
                 
                 # Remove the environment section (e.g., test.deploy.parameters)
                 if self.stage_id in config:
@@ -510,9 +783,20 @@ class StackDestroyer:
                 
                 # Count remaining environments (exclude 'atlantis' and 'version')
                 remaining_envs = [key for key in config.keys() if key not in ['atlantis', 'version']]
-                
-                # If no environments left, delete the file
-                if not remaining_envs:
+
+                if remaining_envs:
+                    # Save updated config to a temp file and swap it in so an interrupted write can't corrupt it
+                    tmp_path = samconfig_path.with_suffix('.toml.tmp')
+                    try:
+                        with open(tmp_path, 'wb') as f:
+                            tomli_w.dump(config, f)
+                        os.replace(tmp_path, samconfig_path)
+                    finally:
+                        tmp_path.unlink(missing_ok=True)
+                    click.echo(Colorize.success("Updated samconfig file"))
+                    Log.info("Updated samconfig file")
+                else:
+                    # If no environments left, delete the file
                     samconfig_path.unlink()
                     click.echo(Colorize.success("Deleted samconfig file (no environments remaining)"))
                     Log.info("Deleted samconfig file (no environments remaining)")
@@ -526,18 +810,12 @@ class StackDestroyer:
                     except OSError:
                         # Directory not empty or other error, ignore
                         pass
-                else:
-                    # Save updated config
-                    with open(samconfig_path, 'w') as f:
-                        toml.dump(config, f)
-                    click.echo(Colorize.success("Updated samconfig file"))
-                    Log.info("Updated samconfig file")
             
             except KeyboardInterrupt:
                 click.echo(Colorize.error("\nOperation cancelled by user"))
                 Log.info("Operation cancelled by user")
                 sys.exit(1)
-            except Exception as e:
+            except (OSError, tomllib.TOMLDecodeError) as e:
                 click.echo(Colorize.error(f"Error updating samconfig: {str(e)}"))
                 Log.error(f"Error updating samconfig: {str(e)}")
 
@@ -602,27 +880,32 @@ class StackDestroyer:
         print()
         click.echo(Colorize.output_bold("Step 5: Beginning Deletion Process"))
 
-        # Delete SSM parameters
+        # Select SSM parameters while the application stack still exists
         print()
-        self.delete_ssm_parameters()
+        parameters_to_delete = self.select_ssm_parameters()
 
-        # Delete application stack first
+        # Delete application stack first, removing SSM parameters while it is torn down
         print()
-        if not self.delete_stack(application_stack_name):
+        if not self.issue_delete_stack(application_stack_name):
             click.echo(Colorize.error("Failed to delete application stack"))
             sys.exit(1)
 
-        # Delete pipeline stack
+        if parameters_to_delete:
+            print()
+            self.delete_ssm_parameters(parameters_to_delete)
+
         print()
-        if not self.delete_stack(pipeline_stack_name):
-            click.echo(Colorize.error("Failed to delete pipeline stack"))
+        if not self.await_delete_stack(application_stack_name):
+            click.echo(Colorize.error("Failed to delete application stack"))
             sys.exit(1)
-        
-        # Delete retained resources
+
+        # Delete pipeline stack (it can only be deleted after the application stack is gone)
         print()
-        self.delete_resources_by_tag()
+        if not self.issue_delete_stack(pipeline_stack_name):
+            click.echo(Colorize.error("Failed to delete pipeline stack"))
+            sys.exit(1)
         
-        # Update samconfig
+        # Update samconfig while the pipeline stack is torn down
         print()
         self.update_samconfig()
         
@@ -632,9 +915,29 @@ class StackDestroyer:
             commit_message += f"-{self.stage_id}"
         print()
         Git.git_commit_and_push(commit_message)
-        
-        print()
-        click.echo(Colorize.success("Pipeline destruction completed successfully!"))
+
+        if self.no_wait:
+            # Retained resources can only be identified once the pipeline stack is gone
+            tag_value = f"{self.prefix}-{self.project_id}-{self.stage_id}"
+            print()
+            click.echo(Colorize.warning(f"Not waiting for stack {pipeline_stack_name} to finish deleting. Retained resources were not checked."))
+            Log.info(f"Not waiting for stack {pipeline_stack_name} to finish deleting (--no-wait)")
+            self.skipped_resources.append(f"Retained resources tagged atlantis:ApplicationDeploymentId={tag_value}")
+
+            print()
+            click.echo(Colorize.success("Pipeline destruction started successfully!"))
+        else:
+            print()
+            if not self.await_delete_stack(pipeline_stack_name):
+                click.echo(Colorize.error("Failed to delete pipeline stack"))
+                sys.exit(1)
+
+            # Delete retained resources
+            print()
+            self.delete_resources_by_tag()
+
+            print()
+            click.echo(Colorize.success("Pipeline destruction completed successfully!"))
 
         print()
         if self.skipped_resources:
@@ -671,7 +974,7 @@ def parse_args() -> argparse.Namespace:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=(EPILOG)
     )
-    parser.add_argument('infra_type', choices=VALID_INFRA_TYPES,
+    parser.add_argument('infra_type', choices=VALID_INFRA_TYPES_CHOICES,
                         help='Type of infrastructure to destroy')
     parser.add_argument('prefix', help='Prefix for stack names')
     parser.add_argument('project_id', help='Project identifier')
@@ -680,6 +983,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--region', help='AWS region')
     parser.add_argument('--no-browser', action='store_true',
                         help='Disable browser-based authentication')
+    parser.add_argument('--no-wait', action='store_true',
+                        help='Do not wait for the pipeline stack to finish deleting (retained resources are not cleaned up)')
+    parser.add_argument('--interactive-per-resource', action='store_true',
+                        help='Confirm each retained resource individually instead of once per service')
+    parser.add_argument('--verbose', action='store_true',
+                        help=f'List all retained resources found instead of the first {RESOURCE_LIST_MAX}')
     
     args = parser.parse_args()
 
@@ -708,7 +1017,10 @@ def main():
             stage_id=args.stage_id,
             profile=args.profile,
             region=args.region,
-            no_browser=args.no_browser
+            no_browser=args.no_browser,
+            no_wait=args.no_wait,
+            interactive_per_resource=args.interactive_per_resource,
+            verbose=args.verbose
         )
         
         destroyer.destroy()
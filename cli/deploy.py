@@ -10,21 +10,19 @@ VERSION = "v0.1.3/2025-08-26"
 # Full Documentation:
 # https://github.com/63klabs/atlantis-cfn-configuration-repo-for-serverless-deployments/
 
+# boto3, botocore, tomli, subprocess and tempfile are imported where they
+# are used so that -h and argument errors don't pay for loading them
+
 import sys
 import os
-import tempfile
-import subprocess
+import shutil
 import argparse
 import traceback
-import tomli  # Make sure to pip install tomli
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
-from botocore.exceptions import ClientError
-
-import boto3
-import botocore
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
 
-from lib.aws_session import AWSSessionManager
 from lib.logger import ScriptLogger, ConsoleAndLog, Log
 from lib.atlantis import DefaultsLoader
 from lib.gitops import Git
@@ -37,8 +35,18 @@ if sys.version_info[0] < 3:
 # Initialize logger for this script
 ScriptLogger.setup('deploy')
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
 SAMCONFIG_DIR = "samconfigs"
 SETTINGS_DIR = "defaults"
+# botocore Config options for the deployer's clients. Each client is created once
+# per deployer, so calls to the same service share its connection pool
+AWS_CLIENT_CONFIG_OPTIONS = {
+    'retries': {'max_attempts': 5, 'mode': 'adaptive'},
+    'tcp_keepalive': True
+}
+S3_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+S3_NOT_FOUND_ERROR_CODES = frozenset({'404', 'NoSuchKey', 'NoSuchVersion'}) # HEAD reports a bare 404
 
 class TemplateDeployer:
     def __init__(self, infra_type: str, prefix: str, project_id: str, stage_id: Optional[str] = "default", profile: Optional[str] = None, no_browser: Optional[bool] = False) -> None:
@@ -48,10 +56,26 @@ class TemplateDeployer:
         self.stage_id = stage_id
         self.profile = profile
 
+        # prefix, project_id and infra_type don't change, so the samconfig location is fixed
+        self._samconfig_dir = REPO_ROOT / SAMCONFIG_DIR / self.prefix / self.project_id
+        self._samconfig_file_name = f"samconfig-{self.prefix}-{self.project_id}-{self.infra_type}.toml"
+        self._samconfig_file_path = self._samconfig_dir / self._samconfig_file_name
+
+        # sam executable and environment used by _run_sam_deploy
+        # Resolving the full path lets sam run without a shell on Windows as well
+        sam_exe = "sam.cmd" if os.name == 'nt' else "sam"
+        self._sam_exe = shutil.which(sam_exe) or sam_exe
+        self._sam_env = {
+            **os.environ,
+            'FORCE_COLOR': '1',
+            'TERM': 'xterm-256color' if os.name != 'nt' else os.environ.get('TERM', '')
+        }
+
+        from botocore.config import Config
+        from lib.aws_session import AWSSessionManager
+
         self.aws_session = AWSSessionManager(profile, None, no_browser)
-        self.s3_client = self.aws_session.get_client('s3')
-        # self.s3_client_anonymous = self.aws_session.get_client('s3', config=botocore.client.Config(signature_version=botocore.UNSIGNED))
-        self.s3_client_anonymous = boto3.client('s3', config=botocore.client.Config(signature_version=botocore.UNSIGNED))
+        self.s3_client = self.aws_session.get_client('s3', config=Config(**AWS_CLIENT_CONFIG_OPTIONS))
 
         config_loader = DefaultsLoader(
             settings_dir=self.get_settings_dir(),
@@ -62,6 +86,33 @@ class TemplateDeployer:
 
         self.settings = config_loader.load_settings()
 
+        # Map each template bucket to its anonymous setting for is_bucket_public()
+        self._bucket_public_map = {
+            location['bucket']: location.get('anonymous', False)
+            for location in reversed(self.settings.get('templates', []))
+        }
+
+    @cached_property
+    def s3_client_anonymous(self):
+        """Unsigned S3 client for public template buckets, created on first use"""
+        import boto3
+        from botocore import UNSIGNED
+        from botocore.config import Config
+        return boto3.client('s3', config=Config(signature_version=UNSIGNED, **AWS_CLIENT_CONFIG_OPTIONS))
+
+    @cached_property
+    def cfn_client(self):
+        """CloudFormation client, created on first use"""
+        from botocore.config import Config
+        return self.aws_session.get_client('cloudformation', config=Config(**AWS_CLIENT_CONFIG_OPTIONS))
+
+    @cached_property
+    def samconfig(self) -> Dict:
+        """Parsed samconfig file, read from disk on first access only"""
+        import tomli # Make sure to pip install tomli
+        with open(self.get_samconfig_file_path(), 'rb') as f:
+            return tomli.load(f)
+
     def get_template_from_config(self) -> str:
         """
         Read template URL from samconfig.toml file.
@@ -70,29 +121,24 @@ class TemplateDeployer:
             str: Template URL from config file
             
         Raises:
-            ValueError: If template parameter is not found in config
+            ValueError: If the config file is missing or invalid, or the template parameter is not found in it
         """
 
         # Log the constructed paths
         ConsoleAndLog.info(f"Config directory: {self.get_samconfig_dir()}")
         ConsoleAndLog.info(f"Config file: {self.get_samconfig_file_name()}")
-        # Verify config directory exists
-        config_path = self.get_samconfig_dir()
-        if not config_path.exists():
-            ConsoleAndLog.error(f"SAM Config directory not found: {self.get_samconfig_dir()}")
-            return 1
         
+        import tomli
         try:
-            config_file = self.get_samconfig_file_path()
-            with open(config_file, 'rb') as f:
-                config = tomli.load(f)
+            config = self.samconfig
             
             # Look for template parameter in stage-specific section
-            template_param = config.get('default', {}).get('deploy', {}).get('parameters', {}).get('template_file')
-            stage_template = config.get(self.stage_id, {}).get('deploy', {}).get('parameters', {}).get('template_file')
+            stage_template = None
+            if self.stage_id != 'default':
+                stage_template = config.get(self.stage_id, {}).get('deploy', {}).get('parameters', {}).get('template_file')
             
             # Use stage-specific template if available, otherwise fall back to default
-            template_url = stage_template or template_param
+            template_url = stage_template or config.get('default', {}).get('deploy', {}).get('parameters', {}).get('template_file')
             
             if not template_url:
                 raise ValueError(f"Template parameter not found in config file for stage '{self.stage_id}'")
@@ -100,7 +146,8 @@ class TemplateDeployer:
             return template_url
             
         except FileNotFoundError:
-            raise ValueError(f"Config file not found: {config_path}")
+            # Also covers a missing samconfig directory
+            raise ValueError(f"Config file not found: {self.get_samconfig_file_path()}")
         except tomli.TOMLDecodeError as e:
             raise ValueError(f"Invalid TOML format in config file: {str(e)}")
 
@@ -117,27 +164,41 @@ class TemplateDeployer:
         Raises:
             ValueError: If the S3 URL format is invalid
         """
-        if not s3_url.startswith('s3://'):
-            raise ValueError(f"Invalid S3 URL format: {s3_url}")
-        
-        # Split URL and query parameters
-        url_parts = s3_url.replace('s3://', '').split('?')
-        path_parts = url_parts[0].split('/')
-        
-        if len(path_parts) < 2:
+        # '#' is a valid character in S3 keys, so don't treat it as a fragment
+        url = urlsplit(s3_url, allow_fragments=False)
+        if url.scheme != 's3' or not url.netloc or not url.path.startswith('/'):
             raise ValueError(f"Invalid S3 URL format: {s3_url}")
         
-        bucket = path_parts[0]
-        key = '/'.join(path_parts[1:])
-        version_id = None
+        bucket = url.netloc
+        key = url.path[1:]
         
-        # Parse query parameters for versionId
-        if len(url_parts) > 1:
-            query_params = dict(param.split('=') for param in url_parts[1].split('&'))
-            version_id = query_params.get('versionId')
+        # Parse query parameters for versionId (percent-decoded)
+        version_id = parse_qs(url.query).get('versionId', [None])[0]
             
         return bucket, key, version_id
 
+    def _s3_error_message(self, e, bucket: str, key: str, version_id: Optional[str] = None) -> Optional[str]:
+        """
+        Build the message for an S3 access denied or not found error.
+        
+        Args:
+            e: The botocore ClientError raised by the S3 call
+            bucket: S3 bucket name
+            key: S3 object key
+            version_id: Optional version ID
+            
+        Returns:
+            str: The error message, or None for other error codes
+        """
+        error_code = e.response['Error']['Code']
+        if error_code == 'AccessDenied':
+            if self.is_bucket_public(bucket):
+                return f"Access denied when using anonymous access for bucket '{bucket}'. The bucket may not be public or may require authentication."
+            return f"Access denied when using authenticated access for bucket '{bucket}'. Check your permissions or try using anonymous access."
+        if error_code in S3_NOT_FOUND_ERROR_CODES:
+            return f"Template file not found: s3://{bucket}/{key}" + (f"?versionId={version_id}" if version_id else "")
+        return None
+
     def verify_s3_object_exists(self, bucket: str, key: str, version_id: Optional[str] = None) -> bool:
         """
         Verify S3 object exists and is accessible.
@@ -151,6 +212,8 @@ class TemplateDeployer:
             bool: True if object exists and is accessible, False otherwise
         """
 
+        from botocore.exceptions import ClientError
+
         # Switch to anonymous client if the bucket is public
         s3_client = self.s3_client_anonymous if self.is_bucket_public(bucket) else self.s3_client
         try:
@@ -161,17 +224,10 @@ class TemplateDeployer:
             s3_client.head_object(**params)
             return True
 
-        except botocore.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'AccessDenied':
-                if self.is_bucket_public(bucket):
-                    error_msg = f"Access denied when using anonymous access for bucket '{bucket}'. The bucket may not be public or may require authentication."
-                else:
-                    error_msg = f"Access denied when using authenticated access for bucket '{bucket}'. Check your permissions or try using anonymous access."
-                
+        except ClientError as e:
+            error_msg = self._s3_error_message(e, bucket, key, version_id)
+            if error_msg:
                 ConsoleAndLog.error(error_msg)
-            elif e.response['Error']['Code'] == '404':
-                ConsoleAndLog.error(f"Template file not found: s3://{bucket}/{key}" + 
-                                (f"?versionId={version_id}" if version_id else ""))
             else:
                 # Re-raise other client errors
                 ConsoleAndLog.error(f"Error accessing S3: {str(e)}")
@@ -190,20 +246,15 @@ class TemplateDeployer:
             int: Return code from sam deploy
         """
         try:
-            # Ensure config file exists
+            # The config file was already read by get_template_from_config()
             config_path = self.get_samconfig_file_path()
-            if not config_path.exists():
-                ConsoleAndLog.error(f"Config file not found: {config_path}")
-                return 1
 
             if template_path.startswith('s3://'):
                 # Handle S3 template
-                bucket, key, version_id = self.parse_s3_url(template_path)
+                import tempfile
+                from botocore.exceptions import ClientError
 
-                
-                # Verify template exists
-                if not self.verify_s3_object_exists(bucket, key, version_id):
-                    return 1
+                bucket, key, version_id = self.parse_s3_url(template_path)
 
                 # Create temp directory for S3 download
                 with tempfile.TemporaryDirectory() as temp_dir:
@@ -224,27 +275,20 @@ class TemplateDeployer:
                             get_args['VersionId'] = version_id
 
                         response = s3_client.get_object(**get_args)
+                        # Stream the body to disk in chunks rather than reading it all into memory
                         with open(temp_path, 'wb') as f:
-                            f.write(response['Body'].read())
-
-                    except botocore.exceptions.ClientError as e:
-                        if e.response['Error']['Code'] == 'AccessDenied':
-                            if self.is_bucket_public(bucket):
-                                error_msg = f"Access denied when using anonymous access for bucket '{bucket}'. The bucket may not be public or may require authentication."
-                            else:
-                                error_msg = f"Access denied when using authenticated access for bucket '{bucket}'. Check your permissions or try using anonymous access."
-                            
-                            ConsoleAndLog.error(error_msg)
-
-                        else:
-                            ConsoleAndLog.error(f"Failed to download template: {str(e)}")
+                            shutil.copyfileobj(response['Body'], f, S3_DOWNLOAD_CHUNK_SIZE)
+
+                    except ClientError as e:
+                        error_msg = self._s3_error_message(e, bucket, key, version_id)
+                        ConsoleAndLog.error(error_msg or f"Failed to download template: {str(e)}")
                         
                         return 1
 
                     return self._run_sam_deploy(temp_path, config_path)
             else:
                 # Handle local template
-                local_template_path = self.config_dir / template_path
+                local_template_path = self.get_samconfig_dir() / template_path
                 if not local_template_path.exists():
                     ConsoleAndLog.error(f"Local template file not found: {local_template_path}")
                     return 1
@@ -263,8 +307,7 @@ class TemplateDeployer:
         ConsoleAndLog.info("Enabling termination protection for the stack...")
         try:
             # Get the stack name from samconfig.toml
-            with open(self.get_samconfig_file_path(), 'rb') as f:
-                config = tomli.load(f)
+            config = self.samconfig
 
             stage = self.stage_id if self.stage_id else 'default'
             stack_name = config.get(stage, {}).get('deploy', {}).get('parameters', {}).get('stack_name')
@@ -274,7 +317,7 @@ class TemplateDeployer:
                 return
 
             # Enable termination protection
-            self.aws_session.get_client('cloudformation').update_termination_protection(
+            self.cfn_client.update_termination_protection(
                 EnableTerminationProtection=True,
                 StackName=stack_name
             )
@@ -296,8 +339,10 @@ class TemplateDeployer:
         Returns:
             int: Return code from sam deploy
         """
+        import subprocess
+
         sam_cmd = [
-            "sam.cmd" if os.name == 'nt' else "sam",
+            self._sam_exe,
             "deploy",
             "--config-env", self.stage_id,
             "--template-file", str(template_path),
@@ -316,12 +361,7 @@ class TemplateDeployer:
             check=False,
             stdout=None,
             stderr=None,
-            shell=True if os.name == 'nt' else False,
-            env={
-                **os.environ,
-                'FORCE_COLOR': '1',
-                'TERM': 'xterm-256color' if os.name != 'nt' else os.environ.get('TERM', '')
-            }
+            env=self._sam_env
         )
         
         return result.returncode
@@ -332,23 +372,19 @@ class TemplateDeployer:
 
     def get_samconfig_dir(self) -> Path:
         """Get the samconfig directory path"""
-        # Get the script's directory in a cross-platform way
-        script_dir = Path(__file__).resolve().parent
-        return script_dir.parent / SAMCONFIG_DIR / self.prefix / self.project_id 
+        return self._samconfig_dir
     
     def get_samconfig_file_name(self) -> str:
         """Get the samconfig file name"""
-        return f"samconfig-{self.prefix}-{self.project_id}-{self.infra_type}.toml"
+        return self._samconfig_file_name
     
     def get_samconfig_file_path(self) -> Path:
         """Get the samconfig file path"""
-        return self.get_samconfig_dir() / self.get_samconfig_file_name()
+        return self._samconfig_file_path
         
     def get_settings_dir(self) -> Path:
         """Get the settings directory path"""
-        # Get the script's directory in a cross-platform way
-        script_dir = Path(__file__).resolve().parent
-        return script_dir.parent / SETTINGS_DIR
+        return REPO_ROOT / SETTINGS_DIR
 
     def is_bucket_public(self, bucket: str) -> bool:
         """Buckets are presumed to be private unless otherwise specified
@@ -360,11 +396,7 @@ class TemplateDeployer:
         Returns:
             bool: True if the bucket is public, False otherwise
         """
-        # Check if the bucket is public
-        for s3_file_list_location in self.settings.get('templates', []):
-            if s3_file_list_location['bucket'] == bucket:
-                return s3_file_list_location.get('anonymous', False)
-        return False
+        return self._bucket_public_map.get(bucket, False)
     
 # =============================================================================
 # ----- Main function ---------------------------------------------------------
@@ -392,8 +424,6 @@ Examples:
 """
         
 def parse_args() -> argparse.Namespace:
-    # Get the script's directory in a cross-platform way
-    script_dir = Path(__file__).resolve().parent
 
     parser = argparse.ArgumentParser(
         description='Deploy CloudFormation template from S3',
@@ -1,22 +1,31 @@
-from .aws_session import AWSSessionManager
-from .logger import ScriptLogger, ConsoleAndLog, Log
-from .tools import Strings, Colorize
-from .atlantis import FileNameListUtils, DefaultsLoader, TagUtils
-from .gh_utils import GitHubUtils
-from .gitops import Git
-from .codecommit_utils import CodeCommitUtils
+import importlib
 
-__all__ = [
-    'AWSSessionManager',
-    'ScriptLogger',
-    'ConsoleAndLog',
-	'Log',
-	'Strings',
-	'Colorize',
-	'FileNameListUtils',
-	'DefaultsLoader',
-	'TagUtils',
-	'GitHubUtils',
-	'Git',
-	'CodeCommitUtils'
-]
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562) so that importing
+# one module, such as lib.logger, doesn't also load boto3, requests, etc.
+_LAZY_IMPORTS = {
+    'AWSSessionManager': 'aws_session',
+    'ScriptLogger': 'logger',
+    'ConsoleAndLog': 'logger',
+    'Log': 'logger',
+    'Strings': 'tools',
+    'Colorize': 'tools',
+    'FileNameListUtils': 'atlantis',
+    'DefaultsLoader': 'atlantis',
+    'TagUtils': 'atlantis',
+    'GitHubUtils': 'gh_utils',
+    'Git': 'gitops',
+    'CodeCommitUtils': 'codecommit_utils'
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -24,12 +24,26 @@ import os
 import subprocess
 import configparser
 import time
+import random
 import boto3
-from typing import Optional, Any
-from botocore.exceptions import ClientError, TokenRetrievalError
+import botocore.session
+from typing import Optional, Any, Dict, Tuple
+from botocore.config import Config
+from botocore.credentials import JSONFileCache
+from botocore.exceptions import ClientError, TokenRetrievalError, UnknownCredentialError
 
 from lib.logger import ConsoleAndLog
 
+# Transient STS errors are retried by botocore with exponential backoff and jitter
+STS_CLIENT_CONFIG = Config(retries={'max_attempts': 3, 'mode': 'standard'})
+SSO_LOGIN_MAX_ATTEMPTS = 3
+SSO_LOGIN_BACKOFF_CAP = 20 # seconds
+# Share temporary credentials with the AWS CLI (and between runs) the same way the CLI does
+CLI_CREDENTIAL_CACHE_DIR = os.path.expanduser(os.path.join('~', '.aws', 'cli', 'cache'))
+CACHED_CREDENTIAL_PROVIDERS = ('assume-role', 'assume-role-with-web-identity', 'sso')
+# os.uname() is not available on Windows; WSL kernels report "microsoft" (WSL1) or "WSL2" in the release
+_IS_WSL = hasattr(os, 'uname') and any(marker in os.uname().release.lower() for marker in ('microsoft', 'wsl'))
+
 class TokenRetrievalError(Exception):
     """Custom exception for AWS token retrieval failures"""
     pass
@@ -40,6 +54,10 @@ class AWSSessionManager:
         self.region = region
         self.session = None
         self.no_browser = no_browser
+        # Clients and account id for the current session, cleared when the session is replaced
+        self._client_cache: Dict[Tuple[str, Optional[str], Optional[Config]], Any] = {}
+        self._account_id: Optional[str] = None
+        self._sso_profile: Optional[bool] = None
         self.refresh_credentials()
 
     def refresh_credentials(self) -> None:
@@ -48,70 +66,70 @@ class AWSSessionManager:
             return
             
         ConsoleAndLog.info(f"Using AWS profile: {self.profile}")
-        max_retries = 3
-        retry_count = 0
         
-        while retry_count < max_retries:
+        try:
+            # First try to create a session with existing credentials
+            self._new_session()
+            ConsoleAndLog.info("Using existing valid credentials")
+            print()
+            return
+        except ClientError as e:
+            error_message = str(e)
+            if not ("ExpiredToken" in error_message or 
+                    "InvalidClientTokenId" in error_message or 
+                    "Token has expired" in error_message):
+                raise
+            if not self._is_sso_profile():
+                raise TokenRetrievalError(
+                    "Credentials have expired. For IAM users, please update your credentials "
+                    "using 'aws configure' or by setting environment variables."
+                )
+        except Exception as e:
+            if not ("Token has expired" in str(e) and self._is_sso_profile()):
+                raise
+
+        # SSO token expired. Only the interactive login is retried here, STS calls are retried by botocore
+        for attempt in range(1, SSO_LOGIN_MAX_ATTEMPTS + 1):
+            ConsoleAndLog.info("Token expired. Initiating SSO login...")
             try:
-                # First try to create a session with existing credentials
-                self.session = boto3.Session(profile_name=self.profile)
-                
-                # Test if credentials are valid using STS
-                try:
-                    sts = self.session.client('sts')
-                    sts.get_caller_identity()
-                    ConsoleAndLog.info("Using existing valid credentials")
-                    print()
-                    return
-                except ClientError as e:
-                    error_message = str(e)
-                    if ("ExpiredToken" in error_message or 
-                        "InvalidClientTokenId" in error_message or 
-                        "Token has expired" in error_message):
-                        if self._is_sso_profile():
-                            ConsoleAndLog.info("Token expired. Initiating SSO login...")
-                            self._refresh_sso_login()
-                            # Create new session after SSO login
-                            self.session = boto3.Session(profile_name=self.profile)
-                            # Verify the new session
-                            sts = self.session.client('sts')
-                            sts.get_caller_identity()
-                            ConsoleAndLog.info("Successfully refreshed SSO credentials")
-                            return
-                        else:
-                            raise TokenRetrievalError(
-                                "Credentials have expired. For IAM users, please update your credentials "
-                                "using 'aws configure' or by setting environment variables."
-                            )
-                    else:
-                        raise
-                        
-            except Exception as e:
-                if "Token has expired" in str(e) and self._is_sso_profile():
-                    ConsoleAndLog.info("Token expired. Initiating SSO login...")
-                    try:
-                        self._refresh_sso_login()
-                        self.session = boto3.Session(profile_name=self.profile)
-                        sts = self.session.client('sts')
-                        sts.get_caller_identity()
-                        ConsoleAndLog.info("Successfully refreshed SSO credentials")
-                        return
-                    except Exception as login_error:
-                        retry_count += 1
-                        ConsoleAndLog.warning(f"SSO login attempt {retry_count}/{max_retries} failed: {str(login_error)}")
-                else:
-                    retry_count += 1
-                    ConsoleAndLog.warning(f"Credential refresh attempt {retry_count}/{max_retries} failed: {str(e)}")
-                
-                if retry_count >= max_retries:
+                self._refresh_sso_login()
+                # Create and verify a new session after SSO login
+                self._new_session()
+                ConsoleAndLog.info("Successfully refreshed SSO credentials")
+                return
+            except Exception as login_error:
+                ConsoleAndLog.warning(f"SSO login attempt {attempt}/{SSO_LOGIN_MAX_ATTEMPTS} failed: {str(login_error)}")
+                if attempt >= SSO_LOGIN_MAX_ATTEMPTS:
                     ConsoleAndLog.error("Failed to refresh credentials after maximum retries")
                     raise
-                
-                time.sleep(2)
+                # Full jitter backoff
+                time.sleep(random.uniform(0, min(SSO_LOGIN_BACKOFF_CAP, 2 ** attempt)))
+
+    def _new_session(self) -> None:
+        """Create a new boto3 session for the profile and verify its credentials with STS"""
+        botocore_session = botocore.session.Session(profile=self.profile)
+        credential_cache = JSONFileCache(CLI_CREDENTIAL_CACHE_DIR)
+        resolver = botocore_session.get_component('credential_provider')
+        for provider_name in CACHED_CREDENTIAL_PROVIDERS:
+            try:
+                resolver.get_provider(provider_name).cache = credential_cache
+            except UnknownCredentialError:
+                pass
 
+        self.session = boto3.Session(botocore_session=botocore_session)
+        self._client_cache.clear()
+        self._account_id = None
+        sts = self.session.client('sts', config=STS_CLIENT_CONFIG)
+        self._account_id = sts.get_caller_identity().get('Account')
 
     def _is_sso_profile(self) -> bool:
-        """Check if the current profile is configured for SSO"""
+        """Check if the current profile is configured for SSO (~/.aws/config is read once)"""
+        if self._sso_profile is None:
+            self._sso_profile = self._read_is_sso_profile()
+        return self._sso_profile
+
+    def _read_is_sso_profile(self) -> bool:
+        """Read ~/.aws/config to check if the current profile is configured for SSO"""
         try:
             config = configparser.ConfigParser()
             config_path = os.path.expanduser("~/.aws/config")
@@ -137,7 +155,7 @@ class AWSSessionManager:
         """Execute AWS SSO login command for specific profile with browser fallback"""
         try:
             # Force no-browser mode in WSL environment
-            if 'WSL' in os.uname().release:
+            if _IS_WSL:
                 self.no_browser = True
                 ConsoleAndLog.info("WSL detected. Running in no-browser mode.")
             elif not self._can_open_browser():
@@ -175,13 +193,19 @@ class AWSSessionManager:
         """Get the current boto3 session"""
         return self.session
 
-    def get_client(self, service_name: str, region: Optional[str] = None) -> Any:
-        """Get a boto3 client for the specified service"""
+    def get_client(self, service_name: str, region: Optional[str] = None, config: Optional[Config] = None) -> Any:
+        """Get a boto3 client for the specified service, optionally with a botocore Config.
+        Clients are created once per service, region, and Config object and then reused."""
         if not self.session:
             raise ValueError("No valid session available")
         if not region:
             region = self.region
-        return self.session.client(service_name, region)
+        key = (service_name, region, config)
+        client = self._client_cache.get(key)
+        if client is None:
+            client = self.session.client(service_name, region, config=config)
+            self._client_cache[key] = client
+        return client
 
     def _can_open_browser(self) -> bool:
         """Check if the current environment can open a browser"""
@@ -201,7 +225,9 @@ class AWSSessionManager:
             return None
     
     def get_account_id(self) -> str:
-        """Get the current account ID"""
+        """Get the current account ID (looked up once per session)"""
         if not self.session:
             raise ValueError("No valid session available")
-        return self.session.client('sts').get_caller_identity().get('Account')
\ No newline at end of file
+        if self._account_id is None:
+            self._account_id = self.get_client('sts').get_caller_identity().get('Account')
+        return self._account_id
\ No newline at end of file
@@ -8,12 +8,20 @@ VERSION = "v0.0.2/2025-08-26"
 CodeCommit functions for automating CodeCommit management.
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from botocore.config import Config
 
 from lib.aws_session import AWSSessionManager, TokenRetrievalError
 
 from .logger import Log
 
+# Tag lookups for several repositories are fanned out over a thread pool that
+# shares one client, so its connection pool must be at least as large
+TAG_LOOKUP_MAX_WORKERS = 16
+CODECOMMIT_CLIENT_CONFIG = Config(max_pool_connections=32)
+
 class CodeCommitUtils:
 
 	def __init__(self, profile: Optional[str] = None, region: Optional[str] = None, no_browser: Optional[bool] = False, aws_session: Optional[AWSSessionManager] = None):
@@ -27,7 +35,18 @@ class CodeCommitUtils:
 			self.aws_session = AWSSessionManager(self.profile, self.region, self.no_browser)
 			
 		self.region = self.aws_session.get_region()
-		self.client = self.aws_session.get_client('codecommit', self.region)
+		self.client = self.aws_session.get_client('codecommit', self.region, CODECOMMIT_CLIENT_CONFIG)
+		# Repository ARNs are built locally rather than looked up with get_repository
+		self.partition = self.aws_session.get_session().get_partition_for_region(self.region)
+		self.account_id = self.aws_session.get_account_id()
+
+	def get_repo_arn(self, repo_name):
+		"""
+		Build the ARN for a CodeCommit repository in the current account and region.
+		:param repo_name: Name of the repository.
+		:return: Repository ARN.
+		"""
+		return f"arn:{self.partition}:codecommit:{self.region}:{self.account_id}:{repo_name}"
 
 	def get_repo_tags(self, repo_name):
 		"""
@@ -36,10 +55,8 @@ class CodeCommitUtils:
 		:return: Dictionary of tags.
 		"""
 		try:
-			# First verify the repository exists and get its ARN
-			repo_info = self.client.get_repository(repositoryName=repo_name)
-			resource_arn = repo_info['repositoryMetadata']['Arn']
-			
+			# A missing repository raises RepositoryDoesNotExistException here
+			resource_arn = self.get_repo_arn(repo_name)
 			response = self.client.list_tags_for_resource(
 				resourceArn=resource_arn
 			)
@@ -54,3 +71,14 @@ class CodeCommitUtils:
 			Log.error(f"Error retrieving tags for repository {repo_name}: {str(e)}")
 			raise
 
+	def get_tags_for_repos(self, repo_names: List[str]) -> Dict[str, Dict[str, str]]:
+		"""
+		Get tags for several CodeCommit repositories, looking them up concurrently.
+		:param repo_names: Names of the repositories.
+		:return: Dictionary of tag dictionaries keyed by repository name.
+		"""
+		if not repo_names:
+			return {}
+		max_workers = min(TAG_LOOKUP_MAX_WORKERS, len(repo_names))
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			return dict(zip(repo_names, executor.map(self.get_repo_tags, repo_names)))
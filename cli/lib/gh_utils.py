@@ -12,9 +12,57 @@ import tempfile
 import os
 import shutil
 import subprocess
+import re
 import json
-
-from typing import Dict, List, Optional
+import time
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import IO, Dict, List, Mapping, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+GITHUB_API_URL = "https://api.github.com"
+# Repository fields requested by get_repositories(), matching those from the REST API used by get_repository()
+GRAPHQL_REPOSITORY_FIELDS = (
+    "name nameWithOwner owner { id login } repositoryTopics(first: 20) { nodes { topic { name } } } "
+    "sshUrl isTemplate templateRepository { name owner { login } } visibility url"
+)
+HTTP_TIMEOUT = (5, 30) # (connect, read) seconds
+HTTP_USER_AGENT = "atlantis-cfn-cli"
+# Retry GETs on rate limiting and gateway errors with exponential backoff, honoring Retry-After
+HTTP_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Downloads kept in memory by download_zip_to_buffer roll over to a temp file beyond this size
+ZIP_BUFFER_MAX_SIZE = 64 * 1024 * 1024
+SEED_WRITE_MAX_WORKERS = 8
+# Latest release tags are cached on disk between runs with their ETag so that stale
+# entries can be revalidated with a conditional request (a 304 doesn't count against the rate limit)
+RELEASE_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache')),
+    'atlantis-cfn', 'gh_releases.json'
+)
+RELEASE_CACHE_TTL = 3600 # seconds
+REPOSITORY_CACHE_TTL = 300 # seconds
+# Scratch clones for the branch structure hold only a README, so keep them in RAM where available
+SCRATCH_CLONE_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+# github.com/owner/repo with an optional tag from either of:
+# https://github.com/63Klabs/atlantis-cfn-configuration-repo-for-serverless-deployments/releases/tag/0.0.8-beta
+# https://github.com/63Klabs/atlantis-cfn-configuration-repo-for-serverless-deployments/archive/refs/tags/0.0.8-beta.zip
+GITHUB_URL_PATTERN = re.compile(
+    r'^(?:[^:/]+://)?github\.com/(?P<owner>[^/?#]+)/(?P<repo>[^/?#]+)'
+    r'(?:/releases/tag/(?P<release_tag>[^/?#]+)|/archive/refs/tags/(?P<archive_tag>[^/?#]+)\.zip)?'
+    r'(?:[/?#].*)?$'
+)
 
 # =============================================================================
 # ----- GITHUB UTILS ----------------------------------------------------------
@@ -22,6 +70,184 @@ from typing import Dict, List, Optional
 
 class GitHubUtils:
 
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    _token: Optional[str] = None
+    _login: Optional[str] = None
+    # Per-process caches of GitHub lookups
+    _latest_release_cache: Dict[Tuple[str, str], str] = {}
+    # Contents of RELEASE_CACHE_FILE, loaded on first use
+    _release_file_cache: Optional[Dict[str, Dict]] = None
+    _release_file_lock = threading.Lock()
+    # Repository metadata is kept with the time.monotonic() it was fetched at
+    _repository_cache: Dict[str, Tuple[float, Dict]] = {}
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Get the requests session shared by all GitHub HTTP calls so that
+        connections to github.com and api.github.com are kept alive and reused.
+        
+        Returns:
+            requests.Session: The shared session
+        """
+        if cls._session is None:
+            # Lookups may run on worker threads, so only one of them builds the session
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=HTTP_RETRY))
+                    session.headers['User-Agent'] = HTTP_USER_AGENT
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def _get_token(cls) -> Optional[str]:
+        """
+        Get the token for GitHub API calls from GH_TOKEN or GITHUB_TOKEN, or else
+        the one the GitHub CLI is logged in with. It is looked up once per process.
+        
+        Returns:
+            Optional[str]: The token, or None if there isn't one
+        """
+        if cls._token is None:
+            token = os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN')
+            if not token and GitHubUtils.is_installed():
+                result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True, check=False)
+                token = result.stdout.strip() if result.returncode == 0 else ''
+            cls._token = token or ''
+        return cls._token or None
+
+    @classmethod
+    def _require_token(cls) -> str:
+        """
+        Get the token for GitHub API calls, for calls that give misleading
+        results without one (e.g., a private repository looks like it doesn't exist).
+        
+        Returns:
+            str: The token
+        
+        Raises:
+            Exception: If no token is available
+        """
+        token = cls._get_token()
+        if not token:
+            raise Exception(
+                "GitHub token required. Authenticate with 'gh auth login' "
+                "or set the GH_TOKEN (or GITHUB_TOKEN) environment variable."
+            )
+        return token
+
+    @classmethod
+    def _api_request(cls, method: str, path: str, extra_headers: Optional[Dict[str, str]] = None, json_body: Optional[Dict] = None) -> requests.Response:
+        """
+        Make an authenticated request to the GitHub API.
+        
+        Args:
+            method (str): HTTP method (e.g., "GET", "POST")
+            path (str): API path (e.g., "/repos/owner/repo")
+            extra_headers (Optional[Dict[str, str]]): Additional request headers (e.g., If-None-Match)
+            json_body (Optional[Dict]): Request body to send as JSON
+        
+        Returns:
+            requests.Response: The response
+        """
+        headers = {'Accept': 'application/vnd.github+json', **(extra_headers or {})}
+        token = cls._get_token()
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        return cls._get_session().request(method, f"{GITHUB_API_URL}{path}", headers=headers, json=json_body, timeout=HTTP_TIMEOUT)
+
+    @classmethod
+    def _api_get(cls, path: str, extra_headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Make an authenticated GET request to the GitHub REST API.
+        
+        Args:
+            path (str): API path (e.g., "/repos/owner/repo")
+            extra_headers (Optional[Dict[str, str]]): Additional request headers (e.g., If-None-Match)
+        
+        Returns:
+            requests.Response: The response
+        """
+        return cls._api_request('GET', path, extra_headers)
+
+    @staticmethod
+    def _api_error_message(response: requests.Response) -> str:
+        """
+        Get the error message from a failed GitHub API response, including
+        any field errors (e.g., "name already exists on this account").
+        
+        Args:
+            response (requests.Response): The failed response
+        
+        Returns:
+            str: The error message
+        """
+        try:
+            data = response.json()
+        except ValueError:
+            return f"{response.status_code} {response.reason}"
+        message = data.get('message', f"{response.status_code} {response.reason}")
+        details = [error.get('message') or error.get('code') for error in data.get('errors', []) if isinstance(error, dict)]
+        return f"{message}: {', '.join(filter(None, details))}" if any(details) else message
+
+    @classmethod
+    def _get_login(cls) -> str:
+        """
+        Get the login of the authenticated GitHub user. It is looked up once per process.
+        
+        Returns:
+            str: The user's login
+        """
+        if cls._login is None:
+            response = cls._api_get("/user")
+            if not response.ok:
+                raise Exception(f"Failed to get authenticated GitHub user: {cls._api_error_message(response)}")
+            cls._login = response.json()['login']
+        return cls._login
+
+    @classmethod
+    def _get_release_file_cache(cls) -> Dict[str, Dict]:
+        """
+        Get the on-disk release cache, reading RELEASE_CACHE_FILE once per process.
+        A missing or unreadable file is treated as an empty cache.
+        
+        Returns:
+            Dict[str, Dict]: Entries of etag, tag_name, and fetched_at keyed by "owner/repo"
+        """
+        with cls._release_file_lock:
+            if cls._release_file_cache is None:
+                try:
+                    with open(RELEASE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                        cls._release_file_cache = json.load(f)
+                except (OSError, ValueError):
+                    cls._release_file_cache = {}
+            return cls._release_file_cache
+
+    @classmethod
+    def _save_release_file_cache_entry(cls, key: str, entry: Dict) -> None:
+        """
+        Record a release cache entry and write the cache back to RELEASE_CACHE_FILE.
+        The cache is only an optimization, so failing to write it is not an error.
+        
+        Args:
+            key (str): "owner/repo"
+            entry (Dict): etag, tag_name, and fetched_at
+        """
+        cache = cls._get_release_file_cache()
+        with cls._release_file_lock:
+            cache[key] = entry
+            try:
+                os.makedirs(os.path.dirname(RELEASE_CACHE_FILE), exist_ok=True)
+                # Write to a temp file and rename it over the cache so a reader never sees a partial file
+                temp_path = f"{RELEASE_CACHE_FILE}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+                os.replace(temp_path, RELEASE_CACHE_FILE)
+            except OSError:
+                pass
+
     @staticmethod
     def is_installed() -> bool:
         """
@@ -55,100 +281,126 @@ class GitHubUtils:
             return False
 
     @staticmethod
-    def parse_repo_info_from_url(url: str) -> Dict[str, str]:
+    @lru_cache(maxsize=512)
+    def parse_repo_info_from_url(url: str) -> Mapping[str, Optional[str]]:
         """
         Parse GitHub repository information from a URL.
+        Results are cached per URL, so the returned mapping is read-only.
         
         Args:
             url (str): GitHub repository URL
         
         Returns:
-            Dict[str, str]: Dictionary containing 'owner', 'repo', and 'tag' keys
+            Mapping[str, Optional[str]]: Mapping containing 'owner', 'repo', and 'tag' keys
         """
-        # Remove the protocol (http/https) and split by '/'
-        parts = url.split("://")[-1].split("/")
-
-        owner = None
-        repo = None
-        tag = None
-        
-        if parts[0] == "github.com":
-        # Extract owner and repo name
-            if len(parts) >= 3:
-                owner = parts[1]
-                repo = parts[2]
-                # Extract tag if present: https://github.com/63Klabs/atlantis-cfn-configuration-repo-for-serverless-deployments/releases/tag/0.0.8-beta
-                if len(parts) >= 5 and parts[3] == "releases" and parts[4] == "tag":
-                    tag = parts[5]
-                # https://github.com/63Klabs/atlantis-cfn-configuration-repo-for-serverless-deployments/archive/refs/tags/0.0.8-beta.zip
-                elif len(parts) >= 7 and parts[3] == "archive" and parts[4] == "refs" and parts[5] == "tags":
-                    tag = parts[6].split(".")[0]
-
-                return {
-                    "owner": owner,
-                    "repo": repo,
-                    "tag": tag
-                }
-            else:
-                raise ValueError("Invalid GitHub URL format")
-        else:
+        match = GITHUB_URL_PATTERN.match(url)
+        if not match:
             raise ValueError("Invalid GitHub URL format")
 
+        return MappingProxyType({
+            "owner": match.group('owner'),
+            "repo": match.group('repo'),
+            "tag": match.group('release_tag') or match.group('archive_tag')
+        })
+
+
+    @staticmethod
+    def build_release_zip_url(owner: str, repo: str, tag: str) -> str:
+        """
+        Build the URL of the source ZIP archive for a release tag.
+        No API call is made, so use this whenever the tag is already known.
+        
+        Args:
+            owner (str): GitHub repository owner
+            repo (str): GitHub repository name
+            tag (str): Release tag (e.g. 'v1.0.0')
+        
+        Returns:
+            str: ZIP archive URL
+        """
+        return f"https://github.com/{owner}/{repo}/archive/refs/tags/{tag}.zip"
 
     @staticmethod
-    def get_latest_release(owner: str, repo: str) -> str:
+    def build_source_zip_url(owner: str, repo: str, ref: str = "main") -> str:
+        """
+        Build the URL of the source ZIP archive for a branch.
+        
+        Args:
+            owner (str): GitHub repository owner
+            repo (str): GitHub repository name
+            ref (str): Branch name
+        
+        Returns:
+            str: ZIP archive URL
         """
-        Get the latest release tag from a GitHub repository
+        return f"https://github.com/{owner}/{repo}/archive/refs/heads/{ref}.zip"
+
+    @classmethod
+    def get_latest_release(cls, owner: str, repo: str, cache_ttl: int = RELEASE_CACHE_TTL) -> str:
+        """
+        Get the latest release tag from a GitHub repository.
+        The tag is looked up once per repository per process and cached on disk
+        between runs. A cached tag older than cache_ttl is revalidated with its ETag.
         
         Args:
             owner (str): GitHub repository owner
             repo (str): GitHub repository name
+            cache_ttl (int): Seconds a tag cached on disk is used without asking GitHub
         
         Returns:
             str: Latest release tag (e.g. 'v1.0.0')
         """
+        if (owner, repo) in cls._latest_release_cache:
+            return cls._latest_release_cache[(owner, repo)]
+
+        key = f"{owner}/{repo}"
+        cached = cls._get_release_file_cache().get(key)
+        if cached and time.time() - cached.get('fetched_at', 0) < cache_ttl:
+            cls._latest_release_cache[(owner, repo)] = cached['tag_name']
+            return cached['tag_name']
+
         try:
-            # Query the GitHub API for latest release
-            response = requests.get(
-                f"https://api.github.com/repos/{owner}/{repo}/releases/latest",
-                headers={
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-            )
-            response.raise_for_status()
-            
-            # Extract the tag name from the response
-            return response.json()['tag_name']
+            # Query the GitHub API for latest release, conditionally if we have an ETag for it
+            extra_headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
+            response = cls._api_get(f"/repos/{owner}/{repo}/releases/latest", extra_headers)
+
+            if response.status_code == 304:
+                tag = cached['tag_name']
+                etag = cached['etag']
+            else:
+                response.raise_for_status()
+                # Extract the tag name from the response
+                tag = response.json()['tag_name']
+                etag = response.headers.get('ETag')
+
+            cls._save_release_file_cache_entry(key, {'etag': etag, 'tag_name': tag, 'fetched_at': time.time()})
+            cls._latest_release_cache[(owner, repo)] = tag
+            return tag
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to get latest release: {str(e)}")
         
-    # @staticmethod
-    # def download_zip_from_url(url: str, zip_path: Optional[str] = None) -> str:
-    #     """
-    #     Download a ZIP file from a GitHub repository URL
-    #     Args:
-    #         url (str): GitHub repository URL
-    #     Returns:
-    #         str: Path to the downloaded ZIP file
-    #     """
-
-    #     # Create a temporary file path with .zip extension
-    #     if zip_path is None:
-    #         zip_path = tempfile.mktemp(suffix='.zip')
-       
-    #     try:
-    #         response = requests.get(url, stream=True)
-    #         response.raise_for_status()  # Raise an exception for HTTP errors
-    #         with open(zip_path, 'wb') as f:
-    #             for chunk in response.iter_content(chunk_size=8192):
-    #                 f.write(chunk)
-    #         return zip_path
-    #     except requests.exceptions.RequestException as e:
-    #         raise Exception(f"Failed to download ZIP file: {str(e)}")
-
-    @staticmethod
-    def download_zip_from_url(url: str, zip_path: Optional[str] = None) -> str:
+    @classmethod
+    def get_latest_releases(cls, repos: List[Tuple[str, str]], max_workers: int = 10) -> Dict[Tuple[str, str], str]:
+        """
+        Get the latest release tags for several GitHub repositories, looking them
+        up concurrently over the shared session.
+        
+        Args:
+            repos (List[Tuple[str, str]]): (owner, repo) pairs
+            max_workers (int): Maximum number of concurrent lookups
+        
+        Returns:
+            Dict[Tuple[str, str], str]: Latest release tag keyed by (owner, repo)
+        """
+        if not repos:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repos))) as executor:
+            tags = executor.map(lambda owner_repo: cls.get_latest_release(*owner_repo), repos)
+            return dict(zip(repos, tags))
+
+    @classmethod
+    def download_zip_from_url(cls, url: str, zip_path: Optional[str] = None) -> str:
         """
         Download a ZIP file from a GitHub repository URL
         Args:
@@ -165,11 +417,12 @@ class GitHubUtils:
                     zip_path = temp_file.name
                     temp_file_created = True
             
-            response = requests.get(url, stream=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with cls._get_session().get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+                response.raise_for_status()  # Raise an exception for HTTP errors
+                # Copy the body to disk in 1 MiB chunks, undoing any transfer encoding such as gzip
+                response.raw.decode_content = True
+                with open(zip_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
             return zip_path
         except requests.exceptions.RequestException as e:
             # Clean up the temporary file if we created one and an error occurred
@@ -177,14 +430,38 @@ class GitHubUtils:
                 os.unlink(zip_path)
             raise Exception(f"Failed to download ZIP file: {str(e)}")
 
+    @classmethod
+    def download_zip_to_buffer(cls, url: str) -> IO[bytes]:
+        """
+        Download a ZIP file from a GitHub repository URL into a seekable buffer
+        that can be passed straight to zipfile.ZipFile. The buffer is held in
+        memory unless the download exceeds ZIP_BUFFER_MAX_SIZE.
+        Args:
+            url (str): GitHub repository URL
+        Returns:
+            IO[bytes]: Buffer positioned at the start of the ZIP file. The caller should close it.
+        """
+        buffer = tempfile.SpooledTemporaryFile(max_size=ZIP_BUFFER_MAX_SIZE, suffix='.zip')
+        try:
+            with cls._get_session().get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+                response.raise_for_status()  # Raise an exception for HTTP errors
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, buffer, DOWNLOAD_CHUNK_SIZE)
+            buffer.seek(0)
+            return buffer
+        except requests.exceptions.RequestException as e:
+            buffer.close()
+            raise Exception(f"Failed to download ZIP file: {str(e)}")
+
 
-    @staticmethod
-    def create_repo(repo_name: str, private: bool = True, description: str = None) -> Dict:
+    @classmethod
+    def create_repo(cls, repo_name: str, private: bool = True, description: str = None) -> bool:
         """
-        Create a GitHub repository using the GitHub CLI
+        Create a GitHub repository using the GitHub REST API
 
         Args:
-            repo_name (str): Repository name
+            repo_name (str): Repository name, "owner/repo" to create it under an
+                organization, or "repo" (or "user/repo") for the authenticated user
             private (bool): Whether the repository should be private
             description (str): Repository description
 
@@ -194,78 +471,197 @@ class GitHubUtils:
         Raises:
             Exception: If the repository creation fails
         """
+        # Fail with instructions up front rather than with a generic API error
+        cls._require_token()
+
         try:
-            
-            # Build the command
-            cmd = ["gh", "repo", "create", repo_name]
+            owner, _, name = repo_name.rpartition('/')
 
-            if private:
-                cmd.append("--private")
-            else:
-                cmd.append("--public")
-                
+            body = {"name": name, "private": private}
             if description:
-                cmd.extend(["--description", description])
-                            
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                body["description"] = description
 
-            return result.returncode == 0
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Failed to create repository: {e.stderr}")
+            # Repositories for the authenticated user and for organizations are created at different endpoints
+            if not owner or owner.lower() == cls._get_login().lower():
+                path = "/user/repos"
+            else:
+                path = f"/orgs/{owner}/repos"
+
+            response = cls._api_request('POST', path, json_body=body)
+            if response.status_code != 201:
+                raise Exception(cls._api_error_message(response))
+
+            # Keep the new repository's metadata so get_repository() doesn't have to ask for it
+            repository = cls._repository_from_api(response.json())
+            cache_key = repo_name if owner else repository['repositoryMetadata']['nameWithOwner']
+            cls._repository_cache[cache_key] = (time.monotonic(), repository)
+            return True
         except Exception as e:
             raise Exception(f"Failed to create repository: {e}")
         
-    @staticmethod
-    def repository_exists(repo_name: str) -> bool:
+    @classmethod
+    def repository_exists(cls, repo_name: str) -> bool:
         """
-        Check if a GitHub repository exists using the GitHub CLI.
+        Check if a GitHub repository exists using the GitHub REST API.
+        A repository already retrieved with get_repository() is known to exist.
         Args:
             repo_name (str): Repository name (e.g., "owner/repo")
         
         Returns:
             bool: True if repository exists, False otherwise
         """
+        if cls._get_cached_repository(repo_name):
+            return True
+
+        # Without a token, GitHub answers 404 for private repositories that do exist
+        cls._require_token()
+
         try:
-            # Use gh CLI to check if the repository exists
-            result = subprocess.run(
-                ["gh", "repo", "view", repo_name],
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0
+            response = cls._api_get(f"/repos/{repo_name}")
+            if response.status_code == 404:
+                return False
+            response.raise_for_status()
+            # Keep the metadata since we have it
+            cls._repository_cache[repo_name] = (time.monotonic(), cls._repository_from_api(response.json()))
+            return True
         except Exception as e:
             raise Exception(f"Failed to check repository existence: {str(e)}")
         
-    @staticmethod
-    def get_repository(repo_name: str) -> Dict[str, str]:
+    @classmethod
+    def get_repository(cls, repo_name: str) -> Dict[str, str]:
         """
-        Get information about a GitHub repository using the GitHub CLI.
+        Get information about a GitHub repository using the GitHub REST API.
+        Information is reused for REPOSITORY_CACHE_TTL seconds.
         Args:
             repo_name (str): Repository name (e.g., "owner/repo")
         Returns:
             Dict[str, str]: Dictionary containing 'exists' and 'repositoryMetadata' keys
         """
+        repository = cls._get_cached_repository(repo_name)
+        if repository:
+            return repository
+
         try:
-            # Use gh CLI to get repository information
-            result = subprocess.run(
-                ["gh", "repo", "view", repo_name, "--json", "name,nameWithOwner,owner,repositoryTopics,sshUrl,isTemplate,templateRepository,visibility,url"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if result.returncode == 0:
-                info = json.loads(result.stdout)
-                info["cloneUrlHttp"] = f"{info.get('url')}.git"
-                info["cloneUrlSsh"] = f"{info.get('sshUrl')}"
-                return {
-                    "exists": True,
-                    "repositoryMetadata": info
-                }
+            response = cls._api_get(f"/repos/{repo_name}")
+            response.raise_for_status()
+            repository = cls._repository_from_api(response.json())
+            cls._repository_cache[repo_name] = (time.monotonic(), repository)
+            return repository
+        except Exception as e:
+            raise Exception(f"Failed to get repository info: {str(e)}")
+
+    @classmethod
+    def get_repositories(cls, repo_names: List[str]) -> Dict[str, Dict]:
+        """
+        Get information about several GitHub repositories with a single GraphQL
+        query. Repositories already in the get_repository() cache are not queried again.
+        Args:
+            repo_names (List[str]): Repository names (e.g., ["owner/repo", ...])
+        Returns:
+            Dict[str, Dict]: Dictionary containing 'exists' and 'repositoryMetadata' keys,
+                keyed by repository name. 'exists' is False for repositories that weren't found.
+        """
+        repositories = {}
+        to_query = []
+        for repo_name in dict.fromkeys(repo_names):
+            repository = cls._get_cached_repository(repo_name)
+            if repository:
+                repositories[repo_name] = repository
             else:
-                raise Exception(f"Failed to get repository info: {result.stderr}")
+                to_query.append(repo_name)
+
+        if not to_query:
+            return repositories
+
+        # One aliased repository field per repository, with owner and name passed as variables
+        variables = {}
+        fields = []
+        for i, repo_name in enumerate(to_query):
+            owner, _, name = repo_name.partition('/')
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+            fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepositoryFields }}")
+        params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(len(to_query)))
+        query = (
+            f"query({params}) {{ {' '.join(fields)} }} "
+            f"fragment RepositoryFields on Repository {{ {GRAPHQL_REPOSITORY_FIELDS} }}"
+        )
+
+        try:
+            response = cls._api_request('POST', "/graphql", json_body={"query": query, "variables": variables})
+            if not response.ok:
+                raise Exception(cls._api_error_message(response))
+            result = response.json()
+            data = result.get('data')
+            if data is None:
+                raise Exception("; ".join(error.get('message', '') for error in result.get('errors', [])))
         except Exception as e:
             raise Exception(f"Failed to get repository info: {str(e)}")
+
+        for i, repo_name in enumerate(to_query):
+            repo = data.get(f"r{i}")
+            if repo is None:
+                # Not found (or not visible with the current token)
+                repositories[repo_name] = {"exists": False, "repositoryMetadata": None}
+                continue
+            info = {
+                **repo,
+                "repositoryTopics": [{"name": node['topic']['name']} for node in repo['repositoryTopics']['nodes']]
+            }
+            info["cloneUrlHttp"] = f"{info.get('url')}.git"
+            info["cloneUrlSsh"] = f"{info.get('sshUrl')}"
+            repository = {"exists": True, "repositoryMetadata": info}
+            cls._repository_cache[repo_name] = (time.monotonic(), repository)
+            repositories[repo_name] = repository
+
+        return repositories
+
+    @classmethod
+    def _get_cached_repository(cls, repo_name: str) -> Optional[Dict]:
+        """
+        Get repository information cached by get_repository() or repository_exists()
+        if it was fetched less than REPOSITORY_CACHE_TTL seconds ago.
+        Args:
+            repo_name (str): Repository name (e.g., "owner/repo")
+        Returns:
+            Optional[Dict]: The cached repository information, or None
+        """
+        cached = cls._repository_cache.get(repo_name)
+        if cached and time.monotonic() - cached[0] < REPOSITORY_CACHE_TTL:
+            return cached[1]
+        return None
+
+    @staticmethod
+    def _repository_from_api(data: Dict) -> Dict:
+        """
+        Convert a REST API repository into the structure returned by get_repository().
+        repositoryMetadata uses the same field names as 'gh repo view --json'.
+        Args:
+            data (Dict): Repository from GET /repos/{owner}/{repo}
+        Returns:
+            Dict: Dictionary containing 'exists' and 'repositoryMetadata' keys
+        """
+        template = data.get('template_repository')
+        info = {
+            "name": data.get('name'),
+            "nameWithOwner": data.get('full_name'),
+            "owner": {"id": data['owner'].get('node_id'), "login": data['owner'].get('login')},
+            "repositoryTopics": [{"name": topic} for topic in data.get('topics', [])],
+            "sshUrl": data.get('ssh_url'),
+            "isTemplate": data.get('is_template', False),
+            "templateRepository": {
+                "name": template.get('name'),
+                "owner": {"login": template['owner'].get('login')}
+            } if template else None,
+            "visibility": (data.get('visibility') or '').upper(),
+            "url": data.get('html_url')
+        }
+        info["cloneUrlHttp"] = f"{info.get('url')}.git"
+        info["cloneUrlSsh"] = f"{info.get('sshUrl')}"
+        return {
+            "exists": True,
+            "repositoryMetadata": info
+        }
     
     @staticmethod
     def create_branch_structure(repo_name: str, readme_content: str, author: str, email: str) -> None:
@@ -278,52 +674,35 @@ class GitHubUtils:
             author (str): Author name for commits
             email (str): Author email for commits
         """
-        temp_dir = tempfile.mkdtemp()
-        try:
-            # Clone the repo
-            subprocess.run(
-                ["gh", "repo", "clone", repo_name, temp_dir],
-                check=True, capture_output=True
-            )
-            os.chdir(temp_dir)
-
-            # Configure git user for this repo
+        with tempfile.TemporaryDirectory(prefix='gh-branches-', dir=SCRATCH_CLONE_DIR) as temp_dir:
+            # Clone the repo, which is still empty, without history or tags
             subprocess.run(
-                ["git", "config", "user.name", author],
-                cwd=temp_dir, check=True, capture_output=True
+                ["gh", "repo", "clone", repo_name, temp_dir, "--", "--depth=1", "--no-tags"],
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
-            subprocess.run(
-                ["git", "config", "user.email", email],
+            # Build the README commit directly with git plumbing instead of
+            # checkout/add/commit, passing the author with -c rather than git config
+            git = ["git", "-c", f"user.name={author}", "-c", f"user.email={email}"]
+            blob = subprocess.run(
+                git + ["hash-object", "-w", "--stdin"],
+                input=readme_content.encode('utf-8'), cwd=temp_dir, check=True, capture_output=True
+            ).stdout.decode().strip()
+            tree = subprocess.run(
+                git + ["mktree"],
+                input=f"100644 blob {blob}\tREADME.md\n".encode(), cwd=temp_dir, check=True, capture_output=True
+            ).stdout.decode().strip()
+            commit = subprocess.run(
+                git + ["commit-tree", tree, "-m", "Initial README.md commit"],
                 cwd=temp_dir, check=True, capture_output=True
-            )
+            ).stdout.decode().strip()
 
-            # Ensure main branch exists and checkout
+            # Push main first so it becomes the default branch, then test and dev from the same commit
+            subprocess.run(["git", "push", "origin", f"{commit}:refs/heads/main"], cwd=temp_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             subprocess.run(
-                ["git", "checkout", "-B", "main"]
-                , cwd=temp_dir, check=True, capture_output=True
+                ["git", "push", "origin", f"{commit}:refs/heads/test", f"{commit}:refs/heads/dev"],
+                cwd=temp_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
 
-            # Create README.md
-            readme_path = os.path.join(temp_dir, "README.md")
-            with open(readme_path, 'w') as f:
-                f.write(readme_content)
-
-            subprocess.run(["git", "add", "README.md"], cwd=temp_dir, check=True, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "Initial README.md commit"], cwd=temp_dir, check=True, capture_output=True)
-            subprocess.run(["git", "push", "-u", "origin", "main"], cwd=temp_dir, check=True, capture_output=True)
-
-            # Create and push test branch from main
-            subprocess.run(["git", "checkout", "-b", "test"], cwd=temp_dir, check=True, capture_output=True)
-            subprocess.run(["git", "push", "-u", "origin", "test"], cwd=temp_dir, check=True, capture_output=True)
-
-            # Create and push dev branch from test
-            subprocess.run(["git", "checkout", "-b", "dev"], cwd=temp_dir, check=True, capture_output=True)
-            subprocess.run(["git", "push", "-u", "origin", "dev"], cwd=temp_dir, check=True, capture_output=True)
-
-        finally:
-            os.chdir("/")
-            shutil.rmtree(temp_dir, ignore_errors=True)
-
     @staticmethod
     def create_init_commit(all_files: List[Dict], repo_name: str, seed_branch: str, author: str, email: str, git_dir: str) -> None:
         """
@@ -342,58 +721,55 @@ class GitHubUtils:
 
             total_files = len(all_files)
 
-            # Clone the repository
+            # Clone only the tip of the seed branch, which also checks it out
             subprocess.run(
-                ["gh", "repo", "clone", repo_name, git_dir],
-                check=True, capture_output=True
+                ["gh", "repo", "clone", repo_name, git_dir, "--",
+                 "--depth=1", "--no-tags", "--single-branch", "--branch", seed_branch],
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
             
             # Configure git user for this repo
             subprocess.run(
                 ["git", "config", "user.name", author],
-                cwd=git_dir, check=True, capture_output=True
+                cwd=git_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
             subprocess.run(
                 ["git", "config", "user.email", email],
-                cwd=git_dir, check=True, capture_output=True
+                cwd=git_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
             
-            # Checkout the dev branch
-            subprocess.run(
-                ["git", "checkout", seed_branch],
-                cwd=git_dir, check=True, capture_output=True
-            )
-            
-            # Copy all files from temp_dir to git_dir
-            for file_info in all_files:
-                file_path = file_info['filePath']
+            # Create the directory structure once rather than per file
+            for directory in {os.path.dirname(file_info['filePath']) for file_info in all_files}:
+                os.makedirs(os.path.join(git_dir, directory), exist_ok=True)
+
+            # Copy all files from temp_dir to git_dir, overlapping the writes
+            def write_file(file_info: Dict) -> None:
                 file_content = file_info['fileContent']
-                
-                # Create directory structure if needed
-                full_path = os.path.join(git_dir, file_path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                
-                # Write file content
+                full_path = os.path.join(git_dir, file_info['filePath'])
                 with open(full_path, 'w' if isinstance(file_content, str) else 'wb') as f:
                     f.write(file_content)
+
+            with ThreadPoolExecutor(max_workers=SEED_WRITE_MAX_WORKERS) as executor:
+                # Consume the results so a failed write raises here
+                list(executor.map(write_file, all_files))
             
             # Add all files
             subprocess.run(
                 ["git", "add", "."],
-                cwd=git_dir, check=True, capture_output=True
+                cwd=git_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
             
             # Commit changes
             commit_message = f'Seeding repository with {total_files} files'
             subprocess.run(
                 ["git", "commit", "-m", commit_message],
-                cwd=git_dir, check=True, capture_output=True
+                cwd=git_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
             
             # Push to remote
             subprocess.run(
                 ["git", "push", "origin", seed_branch],
-                cwd=git_dir, check=True, capture_output=True
+                cwd=git_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error in GitHub CLI command: {e.cmd}\nOutput: {e.stdout.decode() if e.stdout else ''}\nError: {e.stderr.decode() if e.stderr else ''}")
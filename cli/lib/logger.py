@@ -25,7 +25,7 @@ except Exception as e:
 import logging
 import sys
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional
 
 class ScriptLogger:
     _instance = None
@@ -82,9 +82,14 @@ class ScriptLogger:
         return cls._instance
 
 class Log:
+    _file_only_logger: Optional[logging.Logger] = None
+
     @classmethod
     def _get_file_only_logger(cls) -> logging.Logger:
-        """Get a logger instance that only writes to file"""
+        """Get a logger instance that only writes to file (set up on first use)"""
+        if cls._file_only_logger is not None:
+            return cls._file_only_logger
+
         logger = ScriptLogger.get_logger()
         if not logger:
             raise RuntimeError(ScriptLogger._ERROR_MSG)
@@ -94,6 +99,7 @@ class Log:
         
         # If handlers already exist, return the logger
         if file_only_logger.handlers:
+            cls._file_only_logger = file_only_logger
             return file_only_logger
             
         # Copy the file handler from the main logger
@@ -107,6 +113,7 @@ class Log:
                 break
         
         file_only_logger.setLevel(logging.INFO)
+        cls._file_only_logger = file_only_logger
         return file_only_logger
 
     @classmethod
@@ -119,6 +126,9 @@ class Log:
     def warning(cls, message: str, e: Optional[Exception] = None) -> None:
         """Log a warning message to file only"""
         logger = cls._get_file_only_logger()
+        # Skip building the message if it would be discarded
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         if e:
             logger.warning(f"{message} ERR: {str(e)}")
         else:
@@ -128,6 +138,9 @@ class Log:
     def error(cls, message: str, e: Optional[Exception] = None) -> None:
         """Log an error message to file only"""
         logger = cls._get_file_only_logger()
+        # Skip building the message if it would be discarded
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         if e:
             logger.error(f"{message} ERR: {str(e)}")
         else:
@@ -135,40 +148,34 @@ class Log:
 
 class ConsoleAndLog:
     @staticmethod
-    def _log_message(level_func: Callable, message: str, e: Optional[Exception] = None) -> None:
+    def _log_message(level: int, message: str, e: Optional[Exception] = None) -> None:
         """Generic logging function"""
         logger = ScriptLogger.get_logger()
         if not logger:
             raise RuntimeError(ScriptLogger._ERROR_MSG)
         
+        # Skip building the message if it would be discarded
+        if not logger.isEnabledFor(level):
+            return
         if e:
-            level_func(f"{message} ERR: {str(e)}")
+            logger.log(level, f"{message} ERR: {str(e)}")
         else:
-            level_func(message)
+            logger.log(level, message)
     
     @classmethod
     def info(cls, message: str) -> None:
         """Log an info message"""
-        logger = ScriptLogger.get_logger()
-        if not logger:
-            raise RuntimeError(ScriptLogger._ERROR_MSG)
-        cls._log_message(logger.info, message)
+        cls._log_message(logging.INFO, message)
     
     @classmethod
     def warning(cls, message: str, e: Optional[Exception] = None) -> None:
         """Log a warning message"""
-        logger = ScriptLogger.get_logger()
-        if not logger:
-            raise RuntimeError(ScriptLogger._ERROR_MSG)
-        cls._log_message(logger.warning, message, e)
+        cls._log_message(logging.WARNING, message, e)
     
     @classmethod
     def error(cls, message: str, e: Optional[Exception] = None) -> None:
         """Log an error message"""
-        logger = ScriptLogger.get_logger()
-        if not logger:
-            raise RuntimeError(ScriptLogger._ERROR_MSG)
-        cls._log_message(logger.error, message, e)
+        cls._log_message(logging.ERROR, message, e)
 
 # Convenience functions
 def log_info(message: str) -> None:
@@ -13,9 +13,12 @@ import os
 import click
 import datetime
 import random
+import signal
 import string
+import textwrap
+import threading
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from lib.tools_colors import (
     COLOR_PROMPT,
@@ -29,6 +32,43 @@ from lib.tools_colors import (
     COLOR_BOX_TEXT
 )
 
+# Terminal width, looked up once and then again only after the terminal is resized (SIGWINCH).
+# Where SIGWINCH can't be watched (Windows, or a handler can't be installed) it is looked up every time.
+_terminal_columns: Optional[int] = None
+_terminal_columns_valid = False
+_watching_resize: Optional[bool] = None
+
+def _invalidate_terminal_columns(*_args) -> None:
+    """SIGWINCH handler: look the terminal width up again on next use"""
+    global _terminal_columns_valid
+    _terminal_columns_valid = False
+
+def _watch_resize() -> bool:
+    """Install the SIGWINCH handler on first use. Returns True if the terminal width can be cached."""
+    global _watching_resize
+    if _watching_resize is None:
+        _watching_resize = False
+        # Signal handlers can only be installed from the main thread, and shouldn't replace one set by the caller
+        if hasattr(signal, 'SIGWINCH') and threading.current_thread() is threading.main_thread():
+            if signal.getsignal(signal.SIGWINCH) in (signal.SIG_DFL, None):
+                signal.signal(signal.SIGWINCH, _invalidate_terminal_columns)
+                _watching_resize = True
+    return _watching_resize
+
+def _get_terminal_columns() -> Optional[int]:
+    """Get the terminal width in columns, or None if not attached to a terminal"""
+    global _terminal_columns, _terminal_columns_valid
+    if _terminal_columns_valid:
+        return _terminal_columns
+    try:
+        columns = os.get_terminal_size().columns
+    except OSError:
+        columns = None
+    if _watch_resize():
+        _terminal_columns = columns
+        _terminal_columns_valid = True
+    return columns
+
 class Strings:
 
     @classmethod
@@ -59,27 +99,22 @@ class Strings:
         Returns:
             str: Formatted string with appropriate line breaks
         """
-        lines = []
-        line = ""
-        
         # Adjust break point based on terminal width
         break_at = self.get_terminal_width(break_at)
 
-        # Break the string into words and loop through each
-        words = string.split(" ")
-        for word in words:
-            if len(line) + len(word) >= break_at:
-                lines.append(line.rstrip())
-                line = indent
-            line += word + " "
-
-        # Add the final line
-        lines.append(line)
-
-        # Join lines with newlines, removing trailing whitespace
-        lines = "\n".join(lines)
+        # Wrap each existing line on its own so that line breaks already in the string are kept.
+        # Lines are kept shorter than break_at, and long words are never split.
+        lines = []
+        for paragraph in string.split("\n"):
+            lines.extend(textwrap.wrap(
+                paragraph,
+                width=max(break_at - 1, 1),
+                subsequent_indent=indent,
+                break_long_words=False,
+                break_on_hyphens=False
+            ) or [""])
 
-        return lines
+        return "\n".join(lines)
 
     @classmethod
     def print_char_str(self, char: str, num: int, **kwargs) -> str:
@@ -168,11 +203,8 @@ class Strings:
         Returns:
             int: Terminal width or max_width, whichever is smaller
         """
-        try:
-            term_width = os.get_terminal_size().columns
-            return min(term_width, max_width)
-        except OSError:
-            return max_width
+        term_width = _get_terminal_columns()
+        return min(term_width, max_width) if term_width else max_width
 
     @classmethod
     def generate_random_string(self, length: int) -> str: